@@ -14,7 +14,6 @@ import asyncio
 import uuid
 from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
-from datetime import datetime
 from enum import Enum
 
 from fastapi import FastAPI, HTTPException, status, BackgroundTasks
@@ -22,6 +21,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
 from src.config import get_settings
+from src.models.timestamps import utc_now
 
 # Configure logging
 logging.basicConfig(
@@ -176,7 +176,7 @@ async def process_evaluation_job(job_id: str, request_data: EvaluationRequest):
     try:
         # Update job status to processing
         job.status = JobStatus.PROCESSING
-        job.started_at = datetime.utcnow().isoformat()
+        job.started_at = utc_now().isoformat()
         job.progress = "Starting evaluation workflow..."
         logger.info(f"Job {job_id}: Started processing")
 
@@ -251,7 +251,7 @@ async def process_evaluation_job(job_id: str, request_data: EvaluationRequest):
 
         # Update job with results
         job.status = JobStatus.COMPLETED
-        job.completed_at = datetime.utcnow().isoformat()
+        job.completed_at = utc_now().isoformat()
         job.result = evaluation_result
         job.progress = "Evaluation completed successfully"
 
@@ -260,7 +260,7 @@ async def process_evaluation_job(job_id: str, request_data: EvaluationRequest):
     except Exception as e:
         logger.error(f"Job {job_id}: Failed with error: {str(e)}", exc_info=True)
         job.status = JobStatus.FAILED
-        job.completed_at = datetime.utcnow().isoformat()
+        job.completed_at = utc_now().isoformat()
         job.error = str(e)
         job.progress = "Evaluation failed"
 
@@ -315,7 +315,7 @@ async def submit_evaluation(request: EvaluationRequest, background_tasks: Backgr
         job = Job(
             job_id=job_id,
             status=JobStatus.PENDING,
-            created_at=datetime.utcnow().isoformat(),
+            created_at=utc_now().isoformat(),
             request_data={
                 "job_description": request.job_description,
                 "resume": request.resume,
@@ -19,6 +19,7 @@ class Settings(BaseSettings):
     - llama.cpp Server Configuration: External server connection settings
     - OpenAI Configuration: Alternative provider settings
     - Workflow Parameters: Feature flags and execution settings
+    - Response Cache: Reuse of structured LLM responses for identical prompts
     - Output Configuration: Response formatting and content settings
     - API Configuration: FastAPI server settings
     - Observability: Logging and tracing configuration
@@ -106,6 +107,12 @@ class Settings(BaseSettings):
         le=10,
         description="Number of categories in generated rubrics"
     )
+    llm_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum number of LLM requests in flight at once across panel agents"
+    )
     parallel_execution: bool = Field(
         default=True,
         description="Enable parallel execution of panel agents (fan-out/fan-in)"
@@ -117,6 +124,28 @@ class Settings(BaseSettings):
         description="Score delta to flag disagreements between passes"
     )
 
+    # ============================================================================
+    # Response Cache
+    # ============================================================================
+    llm_response_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse structured LLM responses for identical prompts (rubric generation, agent passes)"
+    )
+    llm_response_cache_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file for persisting cached responses across runs (memory-only if unset)"
+    )
+    llm_response_cache_ttl_seconds: int = Field(
+        default=86400,
+        gt=0,
+        description="Time-to-live for cached responses in seconds"
+    )
+    llm_response_cache_max_entries: int = Field(
+        default=256,
+        ge=1,
+        description="Maximum number of responses kept in the in-memory cache"
+    )
+
     # ============================================================================
     # Output Configuration
     # ============================================================================
@@ -16,7 +16,7 @@ multi-stage pipeline.
 ## State Management
 
 The workflow uses LangGraph's reducer system for proper state merging:
-- `panel_reviews`: Appends reviews from parallel agents using operator.add
+- `panel_reviews`: Appends reviews from parallel agents using a custom append function
 - `agent_working_memory`: Merges dictionaries using custom merge function
 - Other fields: Simple replacement (default behavior)
 
@@ -42,10 +42,10 @@ print(result['interview_plan'].questions)
 - Graph-level: Log full state at failure point, return partial results when possible
 """
 
-import operator
+import asyncio
+import inspect
 import logging
-from typing import Dict, List, Optional, TypedDict, Annotated, Any
-from datetime import datetime
+from typing import Dict, List, Optional, Sequence, TypedDict, Annotated, Any
 import time
 
 from langgraph.graph import StateGraph, END
@@ -70,6 +70,7 @@ from src.models import (
     DecisionPacket,
     InterviewPlan,
 )
+from src.models.timestamps import utc_now
 
 # Import config
 from src.config import get_settings
@@ -97,6 +98,26 @@ class WorkflowExecutionError(Exception):
 # Step 2: Define State Schema with Reducers
 # ============================================================================
 
+def append_panel_reviews(
+    existing: List[AgentReview],
+    new: Sequence[AgentReview]
+) -> List[AgentReview]:
+    """
+    Custom reducer function to append panel reviews from parallel agents.
+
+    Unlike operator.add, accepts any sequence for new reviews, so agents can
+    return a single-review tuple instead of allocating a one-element list.
+
+    Args:
+        existing: Current list of panel reviews
+        new: New reviews to append
+
+    Returns:
+        Combined list of panel reviews
+    """
+    return [*(existing or ()), *(new or ())]
+
+
 def merge_agent_memory(
     existing: Dict[str, WorkingMemory],
     new: Dict[str, WorkingMemory]
@@ -123,8 +144,8 @@ def merge_agent_memory(
             # If key already exists, log warning but don't overwrite
             # This shouldn't happen in normal flow but guards against errors
             logger.warning(
-                f"Agent role '{agent_role}' already exists in working memory. "
-                f"Keeping existing entry."
+                "Agent role '%s' already exists in working memory. Keeping existing entry.",
+                agent_role,
             )
 
     return merged
@@ -144,9 +165,10 @@ class AnnotatedHiringWorkflowState(TypedDict):
 
     # Orchestrator output (simple replacement)
     rubric: Optional[Rubric]
+    rubric_json: Optional[str]
 
     # Panel agent outputs (use reducers for parallel execution)
-    panel_reviews: Annotated[List[AgentReview], operator.add]  # Append reviews
+    panel_reviews: Annotated[List[AgentReview], append_panel_reviews]  # Append reviews
     agent_working_memory: Annotated[Dict[str, WorkingMemory], merge_agent_memory]  # Merge dicts
 
     # Synthesis outputs (simple replacement)
@@ -192,7 +214,7 @@ def route_to_panel_agents(state: HiringWorkflowState) -> List[Send]:
         # For now, we'll skip this since it's not in the current codebase
         # agents.append(Send("product_agent", state))
 
-    logger.info(f"Routing to {len(agents)} panel agents")
+    logger.info("Routing to %s panel agents", len(agents))
     return agents
 
 
@@ -236,8 +258,9 @@ def validate_state_node(state: HiringWorkflowState) -> Dict:
     try:
         validate_panel_memory_consistency(state)
         logger.info(
-            f"State validation passed: {len(state['panel_reviews'])} reviews, "
-            f"{len(state['agent_working_memory'])} memory entries"
+            "State validation passed: %s reviews, %s memory entries",
+            len(state['panel_reviews']),
+            len(state['agent_working_memory']),
         )
     except ValueError as e:
         raise StateValidationError(f"State consistency validation failed: {str(e)}")
@@ -254,6 +277,9 @@ def retry_on_failure(max_attempts: int = 3, backoff_base: float = 1.0):
     """
     Decorator for retrying node functions on failure with exponential backoff.
 
+    Async node functions get an async wrapper that backs off with
+    `asyncio.sleep`, so retries don't block concurrently running agents.
+
     Args:
         max_attempts: Maximum number of retry attempts
         backoff_base: Base delay in seconds for exponential backoff
@@ -262,6 +288,33 @@ def retry_on_failure(max_attempts: int = 3, backoff_base: float = 1.0):
         Decorated function with retry logic
     """
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            async def async_wrapper(*args, **kwargs):
+                last_exception = None
+
+                for attempt in range(1, max_attempts + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        last_exception = e
+
+                        if attempt < max_attempts:
+                            delay = backoff_base * (2 ** (attempt - 1))
+                            logger.warning(
+                                "Node '%s' failed on attempt %s/%s. Retrying in %ss... Error: %s",
+                                func.__name__, attempt, max_attempts, delay, e,
+                            )
+                            await asyncio.sleep(delay)
+                        else:
+                            logger.error(
+                                "Node '%s' failed after %s attempts. Error: %s",
+                                func.__name__, max_attempts, e,
+                            )
+
+                raise last_exception
+
+            return async_wrapper
+
         def wrapper(*args, **kwargs):
             last_exception = None
 
@@ -275,14 +328,14 @@ def retry_on_failure(max_attempts: int = 3, backoff_base: float = 1.0):
                         # Calculate exponential backoff delay
                         delay = backoff_base * (2 ** (attempt - 1))
                         logger.warning(
-                            f"Node '{func.__name__}' failed on attempt {attempt}/{max_attempts}. "
-                            f"Retrying in {delay}s... Error: {str(e)}"
+                            "Node '%s' failed on attempt %s/%s. Retrying in %ss... Error: %s",
+                            func.__name__, attempt, max_attempts, delay, e,
                         )
                         time.sleep(delay)
                     else:
                         logger.error(
-                            f"Node '{func.__name__}' failed after {max_attempts} attempts. "
-                            f"Error: {str(e)}"
+                            "Node '%s' failed after %s attempts. Error: %s",
+                            func.__name__, max_attempts, e,
                         )
 
             # Raise the last exception after all retries exhausted
@@ -292,7 +345,8 @@ def retry_on_failure(max_attempts: int = 3, backoff_base: float = 1.0):
     return decorator
 
 
-# Wrap node functions with retry logic
+# Wrap node functions with retry logic; under ainvoke, LangGraph runs the sync
+# nodes (orchestrator, synthesis) in a worker thread, keeping the event loop free
 orchestrator_node_with_retry = retry_on_failure()(orchestrator_node)
 hr_agent_node_with_retry = retry_on_failure()(hr_agent_node)
 tech_agent_node_with_retry = retry_on_failure()(tech_agent_node)
@@ -354,7 +408,7 @@ def create_hiring_workflow() -> StateGraph:
         return compiled_graph
 
     except Exception as e:
-        logger.error(f"Failed to compile workflow graph: {str(e)}")
+        logger.error("Failed to compile workflow graph: %s", e)
         raise WorkflowExecutionError(f"Graph compilation failed: {str(e)}")
 
 
@@ -405,13 +459,14 @@ async def run_hiring_workflow(
             "resume": resume,
             "company_context": company_context,
             "rubric": None,
+            "rubric_json": None,
             "panel_reviews": [],
             "agent_working_memory": {},
             "disagreements": None,
             "decision_packet": None,
             "interview_plan": None,
             "workflow_metadata": {
-                "execution_start": datetime.utcnow().isoformat(),
+                "execution_start": utc_now().isoformat(),
                 "execution_end": None,
                 "node_execution_order": []
             }
@@ -426,27 +481,28 @@ async def run_hiring_workflow(
         duration = end_time - start_time
 
         if result.get("workflow_metadata"):
-            result["workflow_metadata"]["execution_end"] = datetime.utcnow().isoformat()
+            result["workflow_metadata"]["execution_end"] = utc_now().isoformat()
 
         # Log execution summary
         decision_packet = result.get('decision_packet')
         recommendation = decision_packet.recommendation if decision_packet else 'N/A'
         
         logger.info(
-            f"Workflow execution completed successfully. "
-            f"Duration: {duration:.2f}s, "
-            f"Panel reviews: {len(result.get('panel_reviews', []))}, "
-            f"Final recommendation: {recommendation}"
+            "Workflow execution completed successfully. "
+            "Duration: %.2fs, Panel reviews: %s, Final recommendation: %s",
+            duration,
+            len(result.get('panel_reviews', [])),
+            recommendation,
         )
 
         return result
 
     except StateValidationError as e:
-        logger.error(f"State validation failed: {str(e)}")
+        logger.error("State validation failed: %s", e)
         raise WorkflowExecutionError(f"State validation error: {str(e)}")
 
     except Exception as e:
-        logger.error(f"Workflow execution failed: {str(e)}", exc_info=True)
+        logger.error("Workflow execution failed: %s", e, exc_info=True)
         raise WorkflowExecutionError(f"Workflow execution failed: {str(e)}")
 
 
@@ -511,11 +567,11 @@ graph TD
             with open(output_path.replace('.png', '.mmd'), 'w') as f:
                 f.write(mermaid_diagram)
 
-            logger.info(f"Graph visualization saved to {output_path.replace('.png', '.mmd')}")
+            logger.info("Graph visualization saved to %s", output_path.replace('.png', '.mmd'))
             return None
 
         except Exception as e:
-            logger.error(f"Failed to save visualization: {str(e)}")
+            logger.error("Failed to save visualization: %s", e)
             return mermaid_diagram
     else:
         return mermaid_diagram
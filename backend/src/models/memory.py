@@ -46,10 +46,12 @@ Usage Example:
 """
 
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import AbstractSet, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from .timestamps import utc_now
+
 
 class KeyObservation(BaseModel):
     """
@@ -193,8 +195,8 @@ class WorkingMemory(BaseModel):
         description="Unclear statements that need clarification in interview"
     )
     created_at: datetime = Field(
-        default_factory=datetime.now,
-        description="When this working memory was created"
+        default_factory=utc_now,
+        description="When this working memory was created (UTC)"
     )
 
     model_config = ConfigDict(
@@ -245,7 +247,7 @@ class WorkingMemory(BaseModel):
                     "What does 'orchestrated multi-agent system' mean in practice? Scale? Complexity?",
                     "LangGraph experience timeline unclear - when did they start?"
                 ],
-                "created_at": "2024-01-15T10:30:00"
+                "created_at": "2024-01-15T10:30:00Z"
             }
         }
     )
@@ -304,21 +306,27 @@ class WorkingMemory(BaseModel):
             if ref.assessment == assessment
         ]
 
-    def validate_against_rubric(self, rubric) -> bool:
+    def validate_against_rubric(
+        self,
+        rubric,
+        expected_names: Optional[AbstractSet[str]] = None
+    ) -> bool:
         """
         Validate that observation categories match rubric categories.
 
         Args:
             rubric: Rubric object with categories to validate against
+            expected_names: Precomputed set of valid category names; defaults
+                           to the rubric's cached `category_name_set`
 
         Returns:
             True if all observation categories exist in rubric, False otherwise
         """
-        rubric_categories = {cat.name for cat in rubric.categories}
-        observation_categories = {obs.category for obs in self.key_observations}
+        if expected_names is None:
+            expected_names = rubric.category_name_set
 
-        invalid_categories = observation_categories - rubric_categories
-        return len(invalid_categories) == 0
+        # Stops at the first observation outside the rubric
+        return all(obs.category in expected_names for obs in self.key_observations)
 
     def get_priority_gaps(self) -> List[str]:
         """
@@ -10,6 +10,10 @@ from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator, computed_field, ConfigDict
 
+from .timestamps import utc_now
+
+_VALID_AGENT_ROLES = frozenset({"HR", "Tech", "Product", "Compliance"})
+
 
 class Disagreement(BaseModel):
     """Captures significant score disagreements between agents.
@@ -59,28 +63,33 @@ class Disagreement(BaseModel):
                 f"at least one agent score."
             )
 
-        # Validate all scores are in 0-5 range
-        for agent_role, score in self.agent_scores.items():
-            if not isinstance(score, int) or score < 0 or score > 5:
-                raise ValueError(
-                    f"Invalid score {score} for agent '{agent_role}'. "
-                    f"Scores must be integers from 0 to 5."
-                )
+        # Validate all scores are in 0-5 range (pydantic already enforces int)
+        scores = self.agent_scores.values()
+        out_of_range = next(
+            ((role, score) for role, score in self.agent_scores.items() if score < 0 or score > 5),
+            None
+        )
+        if out_of_range:
+            agent_role, score = out_of_range
+            raise ValueError(
+                f"Invalid score {score} for agent '{agent_role}'. "
+                f"Scores must be integers from 0 to 5."
+            )
 
         # Validate there's actual disagreement (delta > 0)
-        if self.score_delta < 1:
+        score_delta = max(scores) - min(scores)
+        if score_delta < 1:
             raise ValueError(
                 f"Category '{self.category_name}' shows no significant disagreement "
-                f"(delta: {self.score_delta}). Only include disagreements with delta >= 1."
+                f"(delta: {float(score_delta)}). Only include disagreements with delta >= 1."
             )
 
         # Validate agent roles are valid
-        valid_roles = {"HR", "Tech", "Product", "Compliance"}
-        invalid_roles = set(self.agent_scores.keys()) - valid_roles
+        invalid_roles = self.agent_scores.keys() - _VALID_AGENT_ROLES
         if invalid_roles:
             raise ValueError(
                 f"Invalid agent roles in disagreement: {invalid_roles}. "
-                f"Valid roles: {valid_roles}"
+                f"Valid roles: {set(_VALID_AGENT_ROLES)}"
             )
 
         return self
@@ -153,8 +162,8 @@ class DecisionPacket(BaseModel):
         description="Significant score disagreements between agents requiring resolution"
     )
     generated_at: datetime = Field(
-        default_factory=datetime.now,
-        description="Timestamp when this decision packet was created"
+        default_factory=utc_now,
+        description="Timestamp (UTC) when this decision packet was created"
     )
 
     @model_validator(mode='after')
@@ -233,7 +242,7 @@ class DecisionPacket(BaseModel):
                             "resolution_approach": "Interview questions on domain learning and hiring workflow understanding"
                         }
                     ],
-                    "generated_at": "2025-01-15T14:30:00"
+                    "generated_at": "2025-01-15T14:30:00Z"
                 }
             ]
         }
@@ -6,9 +6,11 @@ This module defines Pydantic models for structured agent reviews:
 - AgentReview: Complete evaluation from a single agent perspective
 """
 
-from typing import List, Literal, Optional
+import weakref
+from collections import Counter
+from typing import ClassVar, List, Literal, Optional
 
-from pydantic import BaseModel, Field, model_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 
 
 class Evidence(BaseModel):
@@ -16,9 +18,13 @@ class Evidence(BaseModel):
 
     Ensures all scoring decisions are grounded in specific, verifiable
     information from candidate materials.
+
+    Evidence is immutable and hashable by content, so identical citations
+    produced by different agents share a single instance: CategoryScore
+    interns its evidence as it is validated.
     """
 
-    model_config = ConfigDict(validate_assignment=True, extra="forbid")
+    _intern_cache: ClassVar["weakref.WeakValueDictionary[tuple, Evidence]"] = weakref.WeakValueDictionary()
 
     resume_text: str = Field(
         min_length=1,
@@ -34,7 +40,7 @@ class Evidence(BaseModel):
     )
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        frozen=True,
         extra="forbid",
         json_schema_extra={
             "examples": [
@@ -47,6 +53,53 @@ class Evidence(BaseModel):
         }
     )
 
+    @classmethod
+    def intern(
+        cls,
+        resume_text: str,
+        interpretation: str,
+        line_reference: Optional[str] = None,
+    ) -> "Evidence":
+        """Return a shared Evidence instance for the given citation.
+
+        Instances are cached weakly by content, so repeated citations of the
+        same resume line across agent reviews resolve to one object.
+
+        Args:
+            resume_text: Direct quote from the resume
+            interpretation: Why this evidence matters
+            line_reference: Optional location reference
+
+        Returns:
+            Cached or newly validated Evidence instance
+        """
+        key = (resume_text, line_reference, interpretation)
+        evidence = cls._intern_cache.get(key)
+        if evidence is None:
+            evidence = cls(
+                resume_text=resume_text,
+                line_reference=line_reference,
+                interpretation=interpretation,
+            )
+            cls._intern_cache[key] = evidence
+        return evidence
+
+    @classmethod
+    def shared(cls, evidence: "Evidence") -> "Evidence":
+        """Return the interned instance equal to an already-validated citation.
+
+        Unlike `intern`, a miss stores `evidence` itself rather than building a
+        new instance.
+
+        Args:
+            evidence: Validated Evidence instance
+
+        Returns:
+            Previously interned equal instance, or `evidence`
+        """
+        key = (evidence.resume_text, evidence.line_reference, evidence.interpretation)
+        return cls._intern_cache.setdefault(key, evidence)
+
 
 class CategoryScore(BaseModel):
     """Score for a single rubric category with evidence and confidence.
@@ -55,8 +108,6 @@ class CategoryScore(BaseModel):
     and include gaps or missing information for transparency.
     """
 
-    model_config = ConfigDict(validate_assignment=True, extra="forbid")
-
     category_name: str = Field(
         min_length=1,
         description="Must match a category name from the evaluation rubric"
@@ -78,6 +129,12 @@ class CategoryScore(BaseModel):
         description="Confidence level in this score based on evidence quality and completeness"
     )
 
+    @field_validator('evidence')
+    @classmethod
+    def intern_evidence(cls, evidence: List[Evidence]) -> List[Evidence]:
+        """Share identical citations across scores and reviews via the intern cache."""
+        return [Evidence.shared(item) for item in evidence]
+
     @model_validator(mode='after')
     def validate_evidence_not_empty(self) -> 'CategoryScore':
         """Ensure at least one piece of evidence is provided."""
@@ -89,7 +146,7 @@ class CategoryScore(BaseModel):
         return self
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        frozen=True,
         extra="forbid",
         json_schema_extra={
             "examples": [
@@ -127,8 +184,6 @@ class AgentReview(BaseModel):
     with evidence, overall assessment, and follow-up questions.
     """
 
-    model_config = ConfigDict(validate_assignment=True, extra="forbid")
-
     agent_role: Literal["HR", "Tech", "Product", "Compliance"] = Field(
         description="Agent perspective: HR (culture/communication), Tech (technical skills), Product (product sense), Compliance (legal/regulatory)"
     )
@@ -173,10 +228,11 @@ class AgentReview(BaseModel):
     def validate_category_scores_unique(self) -> 'AgentReview':
         """Ensure each category is scored exactly once."""
         category_names = [cs.category_name for cs in self.category_scores]
-        if len(category_names) != len(set(category_names)):
-            duplicates = [name for name in category_names if category_names.count(name) > 1]
+        counts = Counter(category_names)
+        if len(counts) != len(category_names):
+            duplicates = {name for name, count in counts.items() if count > 1}
             raise ValueError(
-                f"Duplicate category scores found: {set(duplicates)}. "
+                f"Duplicate category scores found: {duplicates}. "
                 f"Each category must be scored exactly once."
             )
         return self
@@ -187,7 +243,19 @@ class AgentReview(BaseModel):
         if self.expected_rubric_categories is None:
             return self
 
-        expected_set = set(self.expected_rubric_categories)
+        self.check_rubric_category_coverage(self.expected_rubric_categories)
+        return self
+
+    def check_rubric_category_coverage(self, expected_categories: List[str]) -> None:
+        """Check that category_scores cover exactly the expected categories.
+
+        Args:
+            expected_categories: Rubric category names the review must score
+
+        Raises:
+            ValueError: If categories are missing or unexpected categories are scored
+        """
+        expected_set = set(expected_categories)
         actual_set = {cs.category_name for cs in self.category_scores}
 
         missing_categories = expected_set - actual_set
@@ -205,7 +273,23 @@ class AgentReview(BaseModel):
                 f"Expected categories: {sorted(expected_set)}"
             )
 
-        return self
+    def with_expected_categories(self, expected_categories: List[str]) -> 'AgentReview':
+        """Attach expected rubric categories to an already-validated review.
+
+        Runs only the coverage check instead of the full re-validation that
+        assigning `expected_rubric_categories` would trigger.
+
+        Args:
+            expected_categories: Rubric category names the review must score
+
+        Returns:
+            Copy of this review with expected_rubric_categories set
+
+        Raises:
+            ValueError: If category_scores don't cover exactly the expected categories
+        """
+        self.check_rubric_category_coverage(expected_categories)
+        return self.model_copy(update={"expected_rubric_categories": expected_categories})
 
     def get_score_for_category(self, category_name: str) -> Optional[CategoryScore]:
         """Retrieve the score for a specific category.
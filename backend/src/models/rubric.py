@@ -6,11 +6,17 @@ This module defines Pydantic models for creating and managing evaluation rubrics
 - Rubric: Complete evaluation framework with validation
 """
 
+import hashlib
+import math
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, FrozenSet, List, Optional
 
+import orjson
 from pydantic import BaseModel, Field, model_validator, ConfigDict
 
+from .timestamps import utc_now
+
 
 class ScoringCriteria(BaseModel):
     """Defines what a specific score level (0-5) means for a rubric category.
@@ -19,8 +25,6 @@ class ScoringCriteria(BaseModel):
     consistent evaluation across different reviewers.
     """
 
-    model_config = ConfigDict(validate_assignment=True, extra="forbid")
-
     score_value: int = Field(
         ge=0,
         le=5,
@@ -36,7 +40,7 @@ class ScoringCriteria(BaseModel):
     )
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        frozen=True,
         extra="forbid",
         json_schema_extra={
             "examples": [
@@ -82,8 +86,6 @@ class RubricCategory(BaseModel):
     (e.g., technical skills, domain knowledge) with clear scoring levels.
     """
 
-    model_config = ConfigDict(validate_assignment=True, extra="forbid")
-
     name: str = Field(
         min_length=1,
         description="Category name (e.g., 'Agent Orchestration Depth')"
@@ -125,7 +127,7 @@ class RubricCategory(BaseModel):
         return self
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        frozen=True,
         extra="forbid",
         json_schema_extra={
             "examples": [
@@ -165,8 +167,6 @@ class Rubric(BaseModel):
     and at least one must-have category exists.
     """
 
-    model_config = ConfigDict(validate_assignment=True, extra="forbid")
-
     role_title: str = Field(
         min_length=1,
         description="Job title being evaluated (e.g., 'Senior AI Engineer - Agentic Systems')"
@@ -176,14 +176,25 @@ class Rubric(BaseModel):
         description="Evaluation categories (typically 5 categories covering key competencies)"
     )
     generated_at: datetime = Field(
-        default_factory=datetime.now,
-        description="Timestamp when this rubric was created"
+        default_factory=utc_now,
+        description="Timestamp (UTC) when this rubric was created"
     )
 
     @model_validator(mode='after')
-    def validate_weights_sum(self) -> 'Rubric':
-        """Ensure category weights sum to 1.0 (within tolerance)."""
-        total_weight = sum(category.weight for category in self.categories)
+    def validate_weights_and_must_haves(self) -> 'Rubric':
+        """Ensure weights sum to 1.0 and at least one must-have category exists.
+
+        Both checks share a single pass over the categories. Weights are summed
+        with math.fsum so float rounding cannot push a valid rubric outside
+        the tolerance.
+        """
+        weights = []
+        has_must_have = False
+        for category in self.categories:
+            weights.append(category.weight)
+            has_must_have = has_must_have or category.is_must_have
+
+        total_weight = math.fsum(weights)
         tolerance = 0.01
 
         if abs(total_weight - 1.0) > tolerance:
@@ -193,14 +204,7 @@ class Rubric(BaseModel):
                 f"Weights: {[(c.name, c.weight) for c in self.categories]}"
             )
 
-        return self
-
-    @model_validator(mode='after')
-    def validate_must_have_exists(self) -> 'Rubric':
-        """Ensure at least one must-have category is defined."""
-        must_haves = [c for c in self.categories if c.is_must_have]
-
-        if not must_haves:
+        if not has_must_have:
             raise ValueError(
                 "At least one category must be marked as 'is_must_have' to identify "
                 "critical requirements for the role."
@@ -217,13 +221,72 @@ class Rubric(BaseModel):
         Returns:
             The matching RubricCategory if found, None otherwise
         """
-        for category in self.categories:
-            if category.name == name:
-                return category
-        return None
+        return self._by_name.get(name)
+
+    @cached_property
+    def _by_name(self) -> Dict[str, RubricCategory]:
+        """Index of categories by name, built on first lookup.
+
+        Iterates in reverse so the first category wins if names repeat,
+        matching the original linear-scan semantics.
+        """
+        return {category.name: category for category in reversed(self.categories)}
+
+    @cached_property
+    def category_names(self) -> List[str]:
+        """Category names in rubric order, computed once per rubric instance.
+
+        Returns:
+            List of category names
+        """
+        return [category.name for category in self.categories]
+
+    @cached_property
+    def category_name_set(self) -> FrozenSet[str]:
+        """Category names as a set for membership checks, computed once.
+
+        Returns:
+            Frozen set of category names
+        """
+        return frozenset(self._by_name)
+
+    @cached_property
+    def formatted_category_names(self) -> str:
+        """Bulleted category list for working memory extraction prompts.
+
+        Returns:
+            One "- <name>" line per category
+        """
+        return "\n".join(f"- {name}" for name in self.category_names)
+
+    @cached_property
+    def content_hash(self) -> str:
+        """Digest of the rubric's content, excluding its generation timestamp.
+
+        Two rubrics with the same role, categories, and criteria share a hash
+        even if generated at different times, so it can key content-based caches.
+
+        Returns:
+            Hex BLAKE2b digest of the rubric JSON without `generated_at`
+        """
+        content = self.model_dump_json(exclude={"generated_at"})
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+    @cached_property
+    def prompt_json(self) -> str:
+        """Compact JSON form of the rubric for evaluation prompts.
+
+        Serialized once per rubric instance and reused by every panel agent
+        evaluating against it, since rubrics are not modified after generation.
+        Indentation is omitted since it only adds prompt tokens.
+
+        Returns:
+            The rubric's `model_dump()` serialized with orjson
+        """
+        return orjson.dumps(self.model_dump()).decode()
 
     model_config = ConfigDict(
-        validate_assignment=True,
+        frozen=True,
         extra="forbid",
         json_schema_extra={
             "examples": [
@@ -286,7 +349,7 @@ class Rubric(BaseModel):
                             ]
                         }
                     ],
-                    "generated_at": "2025-01-15T10:30:00"
+                    "generated_at": "2025-01-15T10:30:00Z"
                 }
             ]
         }
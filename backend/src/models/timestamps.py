@@ -0,0 +1,11 @@
+"""Timestamp helper shared by the models and workflow metadata.
+
+All timestamps produced by a workflow run are timezone-aware UTC, so they can
+be compared and serialize consistently (with a `+00:00` offset).
+"""
+
+from datetime import datetime, timezone
+from functools import partial
+
+# Bound once so generating a default timestamp is a single call with a shared tz
+utc_now = partial(datetime.now, timezone.utc)
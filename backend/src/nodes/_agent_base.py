@@ -0,0 +1,341 @@
+"""Shared two-pass evaluation workflow for panel agent nodes.
+
+The HR, Tech, and Compliance agents run the same workflow and differ only in
+their role and evaluation prompt:
+1. Extract WorkingMemory: Gather role-specific observations from the resume
+2. Evaluate with Memory: Generate rubric-based scores using extracted context
+
+`build_agent_node` binds a role and prompt into a LangGraph node function.
+
+Both passes send the static instructions as a system message and the resume,
+rubric, and working memory as a user message, so providers can cache the
+instruction prefix across candidates. Pass 2 also marks the rubric, which is
+shared by every candidate for a job, as a cacheable block ahead of the
+candidate's inputs.
+"""
+
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+import orjson
+from pydantic import BaseModel
+
+from src.models.memory import WorkingMemory
+from src.models.review import AgentReview
+from src.models.rubric import Rubric
+from src.prompts.agent_prompts import (
+    EVALUATION_CANDIDATE_PROMPT,
+    EVALUATION_RUBRIC_PROMPT,
+    WORKING_MEMORY_EXTRACTION_INPUT_PROMPT,
+    WORKING_MEMORY_EXTRACTION_SYSTEM_PROMPT,
+)
+from src.state import HiringWorkflowState
+from src.utils.llm import ainvoke_structured, build_prompt_messages, get_structured_llm
+from src.utils.prompt_helpers import canonicalize_prompt_text
+from src.utils.response_cache import ResponseCache, get_response_cache
+
+logger = logging.getLogger(__name__)
+
+AgentNode = Callable[[HiringWorkflowState], Awaitable[Dict]]
+
+T = TypeVar('T', bound=BaseModel)
+
+@lru_cache(maxsize=8)
+def _extraction_system_prompt(agent_role: str) -> str:
+    """Format the static extraction instructions once per agent role.
+
+    Args:
+        agent_role: Panel agent role (e.g., "HR", "Tech", "Compliance")
+
+    Returns:
+        Extraction system prompt for the role
+    """
+    return WORKING_MEMORY_EXTRACTION_SYSTEM_PROMPT.format(agent_role=agent_role)
+
+
+@lru_cache(maxsize=8)
+def _shared_extraction_input(resume: str, categories: str) -> str:
+    """Format the extraction inputs once per resume and rubric for all agents.
+
+    Args:
+        resume: Candidate resume text
+        categories: Bulleted rubric category list
+
+    Returns:
+        Extraction user prompt with the resume and rubric categories
+    """
+    return WORKING_MEMORY_EXTRACTION_INPUT_PROMPT.format(resume=resume, categories=categories)
+
+
+@lru_cache(maxsize=8)
+def _evaluation_system_prompt(evaluation_prompt: str) -> str:
+    """Unescape a static evaluation system prompt once.
+
+    Args:
+        evaluation_prompt: Role-specific evaluation system prompt template
+
+    Returns:
+        System prompt text with `{{`/`}}` escapes resolved
+    """
+    return evaluation_prompt.format()
+
+
+def _require_inputs(state: HiringWorkflowState) -> Tuple[str, Rubric]:
+    """Fetch and validate the inputs both passes need, once per node run.
+
+    Args:
+        state: Current workflow state containing resume and rubric
+
+    Returns:
+        Tuple of (canonicalized resume, rubric)
+
+    Raises:
+        ValueError: If resume or rubric is missing from state
+    """
+    resume = state.get("resume")
+    rubric = state.get("rubric")
+
+    if not resume:
+        raise ValueError("Resume is missing from state")
+    if not rubric:
+        raise ValueError("Rubric is missing from state")
+
+    # Cosmetic resume differences should not change the prompt bytes (and so miss caches)
+    return canonicalize_prompt_text(resume), rubric
+
+
+async def _cache_io(cache: ResponseCache, operation: Callable[..., Any], *args: Any) -> Any:
+    """Run a response cache operation without blocking the event loop on SQLite.
+
+    Args:
+        cache: Response cache the operation belongs to
+        operation: Bound cache method (e.g. `cache.get`, `cache.set`)
+        *args: Arguments for the operation
+
+    Returns:
+        Result of the operation
+    """
+    # Memory-only lookups are cheap; disk lookups (and commits) run in a worker
+    # thread so concurrent panel agents keep making progress
+    if cache.persistent:
+        return await asyncio.to_thread(operation, *args)
+    return operation(*args)
+
+
+async def _invoke_pass(
+    schema: Type[T],
+    system_prompt: str,
+    user_prompt: str,
+    validate: Callable[[T], T],
+    shared_prompt: Optional[str] = None,
+) -> T:
+    """Run one evaluation pass, reusing a cached response for identical prompts.
+
+    When the response cache is enabled, a previous result for the same prompts
+    is served instead of calling the LLM (e.g. when a Pass-2 failure retries
+    the whole node, or the same candidate is re-run). Results are cached only
+    after `validate` accepts them, so a rejected response is never replayed.
+
+    Args:
+        schema: Pydantic model class the LLM returns
+        system_prompt: Static instructions for the pass
+        user_prompt: Per-request inputs for the pass
+        validate: Checks the result and returns it (possibly updated); raises
+            ValueError to reject it
+        shared_prompt: Inputs shared across requests, sent ahead of
+            `user_prompt` (see `build_prompt_messages`)
+
+    Returns:
+        Validated instance of `schema`
+    """
+    cache = get_response_cache()
+    cache_key = cached = None
+    if cache is not None:
+        prompt_parts = (system_prompt, shared_prompt, user_prompt)
+        cache_key = cache.make_key("\x00".join(p for p in prompt_parts if p is not None), schema)
+        cached = await _cache_io(cache, cache.get, cache_key)
+
+    if cached is not None:
+        logger.debug("Response cache hit for %s", schema.__name__)
+        result = schema.model_validate_json(cached)
+    else:
+        llm = get_structured_llm(schema)
+        logger.debug("Invoking LLM for %s", schema.__name__)
+        result = await ainvoke_structured(llm, build_prompt_messages(system_prompt, user_prompt, shared_prompt))
+
+    result = validate(result)
+
+    if cache_key is not None and cached is None:
+        await _cache_io(cache, cache.set, cache_key, result.model_dump_json())
+
+    return result
+
+
+async def extract_working_memory(resume: str, rubric: Rubric, agent_role: str) -> WorkingMemory:
+    """Extract role-focused observations from resume.
+
+    Args:
+        resume: Candidate resume text
+        rubric: Evaluation rubric whose categories observations must use
+        agent_role: Panel agent role (e.g., "HR", "Tech", "Compliance")
+
+    Returns:
+        WorkingMemory object with role-specific observations
+
+    Raises:
+        ValueError: If the extracted memory fails validation
+    """
+    logger.debug("Extracting working memory for %s agent", agent_role)
+
+    def validate(working_memory: WorkingMemory) -> WorkingMemory:
+        # Validate agent role
+        if working_memory.agent_role != agent_role:
+            raise ValueError(f"Expected agent_role='{agent_role}', got '{working_memory.agent_role}'")
+
+        # Validate working memory against rubric categories
+        if not working_memory.validate_against_rubric(rubric):
+            raise ValueError(
+                "Working memory contains observation categories that do not match rubric categories. "
+                "All observations must align with the provided rubric."
+            )
+        return working_memory
+
+    try:
+        # Role-specific static instructions, plus inputs shared by all agents for this resume and rubric
+        working_memory = await _invoke_pass(
+            WorkingMemory,
+            _extraction_system_prompt(agent_role),
+            _shared_extraction_input(resume, rubric.formatted_category_names),
+            validate,
+        )
+
+        logger.info("Successfully extracted %s observations for %s agent", len(working_memory.key_observations), agent_role)
+        return working_memory
+
+    except Exception as e:
+        # The node and retry wrappers log the error text; only format it here at DEBUG
+        logger.error("Failed to extract working memory for %s agent", agent_role)
+        logger.debug("Working memory extraction error: %s", e)
+        raise
+
+
+async def evaluate_with_memory(
+    resume: str,
+    rubric: Rubric,
+    working_memory: WorkingMemory,
+    agent_role: str,
+    evaluation_prompt: str,
+    rubric_json: Optional[str] = None,
+) -> AgentReview:
+    """Generate a role-specific evaluation using working memory context.
+
+    Args:
+        resume: Candidate resume text
+        rubric: Evaluation rubric to score against
+        working_memory: Previously extracted observations and context
+        agent_role: Panel agent role (e.g., "HR", "Tech", "Compliance")
+        evaluation_prompt: Role-specific evaluation system prompt
+        rubric_json: Rubric JSON pre-serialized by the orchestrator; defaults
+            to the rubric's cached `prompt_json`
+
+    Returns:
+        AgentReview object with role-specific category scores
+
+    Raises:
+        ValueError: If the review fails validation
+    """
+    logger.debug("Evaluating resume with %s working memory", agent_role)
+
+    # Format rubric and working memory as JSON for prompt; the creation timestamp is
+    # left out so the same memory always yields the same prompt
+    rubric_json = rubric_json or rubric.prompt_json
+    memory_json = orjson.dumps(working_memory.model_dump(exclude={"created_at"})).decode()
+
+    # Expected category names for validation
+    expected_categories = rubric.category_names
+
+    def validate(review: AgentReview) -> AgentReview:
+        # Attach expected categories, checking rubric coverage without full re-validation
+        review = review.with_expected_categories(expected_categories)
+
+        # Validate agent role
+        if review.agent_role != agent_role:
+            raise ValueError(f"Expected agent_role='{agent_role}', got '{review.agent_role}'")
+        return review
+
+    try:
+        # Static role instructions first, then the job's rubric, then the per-candidate context
+        review = await _invoke_pass(
+            AgentReview,
+            _evaluation_system_prompt(evaluation_prompt),
+            EVALUATION_CANDIDATE_PROMPT.format(resume=resume, working_memory=memory_json),
+            validate,
+            shared_prompt=EVALUATION_RUBRIC_PROMPT.format(rubric=rubric_json),
+        )
+
+        logger.info("Successfully generated %s evaluation with %s category scores", agent_role, len(review.category_scores))
+        return review
+
+    except Exception as e:
+        # The node and retry wrappers log the error text; only format it here at DEBUG
+        logger.error("Failed to generate %s evaluation", agent_role)
+        logger.debug("%s evaluation error: %s", agent_role, e)
+        raise
+
+
+def build_agent_node(agent_role: str, evaluation_prompt: str) -> AgentNode:
+    """Build a two-pass panel agent node for the given role.
+
+    The returned node executes a two-pass evaluation process:
+    1. Extract working memory: Gather observations relevant to the role
+    2. Evaluate with memory: Generate rubric-based scores using extracted context
+
+    The node is async so LangGraph can run the panel agents concurrently; only
+    the two passes within a single agent are sequential.
+
+    Args:
+        agent_role: Panel agent role (e.g., "HR", "Tech", "Compliance")
+        evaluation_prompt: Role-specific evaluation system prompt
+
+    Returns:
+        Async node function accepting HiringWorkflowState and returning a
+        dictionary with state updates:
+        - panel_reviews: Single-review tuple (appended by LangGraph reducer)
+        - agent_working_memory: Single-entry dict mapping the role to its WorkingMemory
+          (merged with other agents' entries by LangGraph reducer)
+    """
+
+    async def agent_node(state: HiringWorkflowState) -> Dict:
+        logger.info("Starting %s agent evaluation", agent_role)
+
+        try:
+            # Validate inputs once for both passes
+            resume, rubric = _require_inputs(state)
+
+            # Pass 1: Extract working memory
+            working_memory = await extract_working_memory(resume, rubric, agent_role)
+            logger.debug("%s working memory extracted: %d observations, %d cross-references",
+                         agent_role, len(working_memory.key_observations), len(working_memory.cross_references))
+
+            # Pass 2: Evaluate with memory context
+            review = await evaluate_with_memory(
+                resume, rubric, working_memory, agent_role, evaluation_prompt, state.get("rubric_json")
+            )
+            logger.info("%s evaluation completed successfully with %s categories scored", agent_role, len(review.category_scores))
+
+            # Return state updates; only this agent's memory is returned so parallel
+            # agents don't overwrite each other's entries
+            return {
+                "panel_reviews": (review,),  # Will be appended by LangGraph reducer
+                "agent_working_memory": {agent_role: working_memory},  # Merged by LangGraph reducer
+            }
+
+        except Exception as e:
+            logger.error("%s agent node failed: %s", agent_role, e)
+            raise
+
+    agent_node.__name__ = f"{agent_role.lower()}_agent_node"
+    agent_node.__qualname__ = agent_node.__name__
+    return agent_node
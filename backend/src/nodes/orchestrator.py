@@ -6,6 +6,8 @@ evaluation rubric based on the job description, resume, and company context.
 """
 
 import logging
+import re
+from functools import lru_cache
 from typing import Dict
 
 from pydantic import ValidationError
@@ -15,6 +17,7 @@ from ..models.rubric import Rubric
 from ..prompts.orchestrator_prompts import RUBRIC_GENERATION_PROMPT
 from ..state import HiringWorkflowState
 from ..utils.llm import get_structured_llm
+from ..utils.response_cache import cached_invoke, get_response_cache
 from ..utils.validators import (
     validate_rubric_completeness,
     validate_rubric_quality,
@@ -24,6 +27,32 @@ from ..utils.validators import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Stand-ins for per-request inputs in the pre-formatted prompt. They are filled
+# in a single pass over the template, so slot-like text in the inputs is never
+# substituted again.
+_JOB_DESCRIPTION_SLOT = "\x00job_description\x00"
+_COMPANY_CONTEXT_SLOT = "\x00company_context\x00"
+_SLOT_PATTERN = re.compile(f"{re.escape(_JOB_DESCRIPTION_SLOT)}|{re.escape(_COMPANY_CONTEXT_SLOT)}")
+
+
+@lru_cache(maxsize=4)
+def _rubric_prompt_template(rubric_categories_count: int) -> str:
+    """
+    Format the rubric prompt once per category count, leaving per-request slots.
+
+    Args:
+        rubric_categories_count: Number of rubric categories to request
+
+    Returns:
+        Rubric generation prompt with `_JOB_DESCRIPTION_SLOT` and
+        `_COMPANY_CONTEXT_SLOT` in place of the per-request inputs
+    """
+    return RUBRIC_GENERATION_PROMPT.format(
+        rubric_categories_count=rubric_categories_count,
+        job_description=_JOB_DESCRIPTION_SLOT,
+        company_context=_COMPANY_CONTEXT_SLOT,
+    )
+
 
 def orchestrator_node(state: HiringWorkflowState) -> Dict:
     """
@@ -40,8 +69,9 @@ def orchestrator_node(state: HiringWorkflowState) -> Dict:
             - company_context: Optional company-specific evaluation priorities
 
     Returns:
-        Dictionary with single key 'rubric' containing the generated Rubric object.
-        LangGraph will merge this into the existing state.
+        Dictionary with key 'rubric' containing the generated Rubric object and
+        'rubric_json' containing its prompt JSON, serialized once here so the
+        panel agents can reuse it. LangGraph will merge this into the existing state.
 
     Raises:
         ValueError: If required inputs are missing or invalid
@@ -74,38 +104,39 @@ def orchestrator_node(state: HiringWorkflowState) -> Dict:
     # Get settings for prompt formatting
     settings = get_settings()
     rubric_categories_count = settings.rubric_categories_count
-    logger.info(f"Generating rubric with {rubric_categories_count} categories")
-
-    # Format the prompt with inputs
-    formatted_prompt = RUBRIC_GENERATION_PROMPT.format(
-        rubric_categories_count=rubric_categories_count,
-        job_description=job_description,
-        company_context=company_context,
+    logger.info("Generating rubric with %s categories", rubric_categories_count)
+
+    # Fill the per-request inputs into the prompt pre-formatted for this category count
+    slot_values = {
+        _JOB_DESCRIPTION_SLOT: job_description,
+        _COMPANY_CONTEXT_SLOT: company_context,
+    }
+    formatted_prompt = _SLOT_PATTERN.sub(
+        lambda match: slot_values[match.group()],
+        _rubric_prompt_template(rubric_categories_count),
     )
 
     try:
         # Get structured LLM instance for Rubric generation
         llm = get_structured_llm(Rubric)
 
-        # Invoke LLM to generate rubric
+        # Invoke LLM to generate rubric (identical prompts reuse a cached rubric if enabled)
         logger.debug("Invoking LLM for rubric generation")
-        rubric: Rubric = llm.invoke(formatted_prompt)
-        logger.info(
-            f"Successfully generated rubric with {len(rubric.categories)} categories"
-        )
+        rubric: Rubric = cached_invoke(llm, formatted_prompt, Rubric, get_response_cache())
+        logger.info("Successfully generated rubric with %s categories", len(rubric.categories))
 
     except ValidationError as e:
-        logger.error(f"Pydantic validation failed for generated rubric: {e}")
+        logger.error("Pydantic validation failed for generated rubric: %s", e)
         raise ValueError(
             f"LLM returned invalid rubric structure: {e}"
         ) from e
 
     except ValueError as e:
-        logger.error(f"LLM utility error: {e}")
+        logger.error("LLM utility error: %s", e)
         raise
 
     except Exception as e:
-        logger.error(f"Unexpected error during rubric generation: {e}")
+        logger.error("Unexpected error during rubric generation: %s", e)
         raise Exception(
             f"Failed to generate rubric: {str(e)}"
         ) from e
@@ -117,29 +148,29 @@ def orchestrator_node(state: HiringWorkflowState) -> Dict:
     is_complete, completeness_issues = validate_rubric_completeness(rubric)
     if not is_complete:
         for issue in completeness_issues:
-            logger.warning(f"Completeness check: {issue}")
+            logger.warning("Completeness check: %s", issue)
 
     # Validate quality
     is_quality, quality_issues = validate_rubric_quality(rubric)
     if not is_quality:
         for issue in quality_issues:
-            logger.warning(f"Quality check: {issue}")
+            logger.warning("Quality check: %s", issue)
 
     # Validate weight distribution
     is_weighted, weight_issues = validate_weight_distribution(rubric)
     if not is_weighted:
         for issue in weight_issues:
-            logger.warning(f"Weight distribution check: {issue}")
+            logger.warning("Weight distribution check: %s", issue)
 
     # Log validation summary
     total_issues = len(completeness_issues) + len(quality_issues) + len(weight_issues)
     if total_issues > 0:
         logger.warning(
-            f"Rubric generated with {total_issues} validation warning(s). "
-            "See logs for details."
+            "Rubric generated with %s validation warning(s). See logs for details.",
+            total_issues,
         )
     else:
         logger.info("Rubric passed all validation checks")
 
-    # Return updated state
-    return {"rubric": rubric}
+    # Return updated state with the rubric pre-serialized for panel agent prompts
+    return {"rubric": rubric, "rubric_json": rubric.prompt_json}
@@ -8,8 +8,10 @@ This node:
 4. Generates an interview plan to resolve ambiguities and disagreements
 """
 
+import heapq
 import logging
-from typing import Dict, List
+from collections import Counter
+from typing import Dict, List, Optional
 
 from src.state import HiringWorkflowState
 from src.models.packet import Disagreement, DecisionPacket
@@ -20,10 +22,31 @@ from src.models.rubric import Rubric
 
 logger = logging.getLogger(__name__)
 
+# Category name -> {agent role -> score}
+ScoreIndex = Dict[str, Dict[str, int]]
+
+
+def _build_score_index(panel_reviews: List[AgentReview]) -> ScoreIndex:
+    """
+    Index agent scores by category so synthesis steps avoid rescanning reviews.
+
+    Args:
+        panel_reviews: List of agent reviews
+
+    Returns:
+        Mapping of category name to {agent_role: score}, in review order
+    """
+    score_index: ScoreIndex = {}
+    for review in panel_reviews:
+        for score_item in review.category_scores:
+            score_index.setdefault(score_item.category_name, {})[review.agent_role] = score_item.score
+    return score_index
+
 
 def _detect_disagreements(
     panel_reviews: List[AgentReview],
-    rubric: Rubric
+    rubric: Rubric,
+    score_index: Optional[ScoreIndex] = None
 ) -> List[Disagreement]:
     """
     Detect disagreements between agent scores across rubric categories.
@@ -34,46 +57,46 @@ def _detect_disagreements(
     Args:
         panel_reviews: List of agent reviews to compare
         rubric: Rubric defining evaluation categories
+        score_index: Precomputed category score index (built from panel_reviews if omitted)
 
     Returns:
         List of Disagreement objects
     """
-    logger.debug(f"Detecting disagreements across {len(panel_reviews)} panel reviews")
+    logger.debug("Detecting disagreements across %s panel reviews", len(panel_reviews))
+
+    if score_index is None:
+        score_index = _build_score_index(panel_reviews)
 
     disagreements = []
 
-    # For each rubric category, collect agent scores
+    # For each rubric category, look up agent scores
     for category in rubric.categories:
         category_name = category.name
-        agent_scores = {}
-
-        # Collect scores from all agents for this category
-        for review in panel_reviews:
-            agent_role = review.agent_role
-            # Find the score for this category
-            for score_item in review.category_scores:
-                if score_item.category_name == category_name:
-                    agent_scores[agent_role] = score_item.score
-                    break
+        agent_scores = score_index.get(category_name, {})
 
         # Skip if less than 2 agents scored this category
         if len(agent_scores) < 2:
-            logger.debug(f"Skipping category '{category_name}' - only {len(agent_scores)} agent(s) scored it")
+            logger.debug("Skipping category '%s' - only %s agent(s) scored it", category_name, len(agent_scores))
             continue
 
-        # Calculate score delta
-        scores = list(agent_scores.values())
-        max_score = max(scores)
-        min_score = min(scores)
+        # Find max/min scores and the agents holding them in a single pass
+        high_agents: List[str] = []
+        low_agents: List[str] = []
+        max_score = min_score = next(iter(agent_scores.values()))
+        for role, score in agent_scores.items():
+            if score > max_score:
+                max_score, high_agents = score, [role]
+            elif score == max_score:
+                high_agents.append(role)
+            if score < min_score:
+                min_score, low_agents = score, [role]
+            elif score == min_score:
+                low_agents.append(role)
         delta = max_score - min_score
 
         # Detect disagreement if delta >= 1.0
         if delta >= 1.0:
-            logger.info(f"Disagreement detected in '{category_name}': delta={delta:.1f}")
-
-            # Identify which agents scored high vs low
-            high_agents = [role for role, score in agent_scores.items() if score == max_score]
-            low_agents = [role for role, score in agent_scores.items() if score == min_score]
+            logger.info("Disagreement detected in '%s': delta=%.1f", category_name, delta)
 
             # Generate initial reason
             reason = (
@@ -96,7 +119,7 @@ def _detect_disagreements(
             )
             disagreements.append(disagreement)
 
-    logger.info(f"Detected {len(disagreements)} disagreement(s)")
+    logger.info("Detected %s disagreement(s)", len(disagreements))
     return disagreements
 
 
@@ -117,85 +140,81 @@ def _enrich_disagreements_with_memory(
     Returns:
         Enriched list of disagreements
     """
-    logger.debug(f"Enriching {len(disagreements)} disagreements with working memory context")
+    logger.debug("Enriching %s disagreements with working memory context", len(disagreements))
 
     if not agent_working_memory:
         logger.warning("No working memory available - cannot enrich disagreements")
         return disagreements
 
+    # Lowercase each observation category once, grouped by agent role
+    memory_index = {
+        agent_role: [(obs.category.lower(), obs) for obs in memory.key_observations]
+        for agent_role, memory in agent_working_memory.items()
+    }
+
     enriched_disagreements = []
 
     for disagreement in disagreements:
         category_name = disagreement.category_name
-        enriched_reason = disagreement.reason + "\n\nWorking Memory Context:"
+        category_lower = category_name.lower()
+        reason_parts = [disagreement.reason + "\n\nWorking Memory Context:"]
 
         # For each agent that scored this category, get their working memory
         for agent_role, score in disagreement.agent_scores.items():
-            if agent_role not in agent_working_memory:
-                logger.debug(f"No working memory found for {agent_role}")
+            if agent_role not in memory_index:
+                logger.debug("No working memory found for %s", agent_role)
                 continue
 
-            memory = agent_working_memory[agent_role]
-
             # Find observations related to this category
             relevant_observations = [
-                obs for obs in memory.key_observations
-                if category_name.lower() in obs.category.lower()
+                obs for obs_category, obs in memory_index[agent_role]
+                if category_lower in obs_category
             ]
 
             # Add agent-specific context
             if relevant_observations:
-                enriched_reason += f"\n- {agent_role} (score: {score}) noted:"
+                reason_parts.append(f"- {agent_role} (score: {score}) noted:")
                 for obs in relevant_observations[:2]:  # Limit to 2 most relevant
-                    obs_text = f"{obs.observation}"
+                    obs_parts = ["  •", obs.observation]
                     if obs.evidence_location:
-                        obs_text += f" (from {obs.evidence_location})"
+                        obs_parts.append(f"(from {obs.evidence_location})")
                     if obs.strength_or_risk:
-                        obs_text += f" [{obs.strength_or_risk}]"
-                    enriched_reason += f"\n  • {obs_text}"
+                        obs_parts.append(f"[{obs.strength_or_risk}]")
+                    reason_parts.append(" ".join(obs_parts))
             else:
-                enriched_reason += f"\n- {agent_role} (score: {score}): No specific observations recorded for this category"
-
-        # Create enriched disagreement
-        enriched_disagreement = Disagreement(
-            category_name=disagreement.category_name,
-            agent_scores=disagreement.agent_scores,
-            reason=enriched_reason,
-            resolution_approach=disagreement.resolution_approach
-        )
+                reason_parts.append(f"- {agent_role} (score: {score}): No specific observations recorded for this category")
+
+        enriched_reason = "\n".join(reason_parts)
+
+        # Create enriched disagreement (already validated, so only the reason is swapped in)
+        enriched_disagreement = disagreement.model_copy(update={"reason": enriched_reason})
         enriched_disagreements.append(enriched_disagreement)
 
-        logger.debug(f"Enriched disagreement for category '{category_name}'")
+        logger.debug("Enriched disagreement for category '%s'", category_name)
 
     return enriched_disagreements
 
 
 def _calculate_weighted_average_score(
     category_name: str,
-    panel_reviews: List[AgentReview]
+    score_index: ScoreIndex
 ) -> float:
     """
     Calculate the average score for a category across all agent reviews.
 
     Args:
         category_name: Name of the rubric category
-        panel_reviews: List of agent reviews
+        score_index: Category score index from `_build_score_index`
 
     Returns:
         Average score for the category
     """
-    scores = []
-
-    for review in panel_reviews:
-        for score_item in review.category_scores:
-            if score_item.category_name == category_name:
-                scores.append(score_item.score)
-                break
+    scores = score_index.get(category_name)
 
     if not scores:
         return 0.0
 
-    return sum(scores) / len(scores)
+    return sum(scores.values()) / len(scores)
 
 
 def _deduplicate_strengths_risks(items: List[str]) -> List[str]:
@@ -208,30 +227,27 @@ def _deduplicate_strengths_risks(items: List[str]) -> List[str]:
     Returns:
         Deduplicated list (max 5 items)
     """
-    # Count frequency of similar items (simple implementation)
-    item_counts = {}
+    # Count frequency of similar items, keeping the first original wording
+    counts: Counter = Counter()
+    originals: Dict[str, str] = {}
     for item in items:
         # Normalize for comparison
         key = item.lower().strip()
-        if key not in item_counts:
-            item_counts[key] = {"original": item, "count": 0}
-        item_counts[key]["count"] += 1
-
-    # Sort by frequency (descending) and take top 5
-    sorted_items = sorted(
-        item_counts.values(),
-        key=lambda x: x["count"],
-        reverse=True
-    )
+        counts[key] += 1
+        originals.setdefault(key, item)
+
+    # Take top 5 by frequency (ties keep first-seen order)
+    top_items = heapq.nlargest(5, counts.items(), key=lambda kv: kv[1])
 
-    return [item["original"] for item in sorted_items[:5]]
+    return [originals[key] for key, _ in top_items]
 
 
 def _create_decision_packet(
     rubric: Rubric,
     panel_reviews: List[AgentReview],
     disagreements: List[Disagreement],
-    agent_working_memory: Dict[str, WorkingMemory]
+    agent_working_memory: Dict[str, WorkingMemory],
+    score_index: Optional[ScoreIndex] = None
 ) -> DecisionPacket:
     """
     Create a decision packet aggregating panel reviews and scoring.
@@ -241,29 +257,33 @@ def _create_decision_packet(
         panel_reviews: List of agent reviews
         disagreements: List of detected disagreements
         agent_working_memory: Agent working memory
+        score_index: Precomputed category score index (built from panel_reviews if omitted)
 
     Returns:
         DecisionPacket with aggregated decision
     """
     logger.debug("Creating decision packet")
 
+    if score_index is None:
+        score_index = _build_score_index(panel_reviews)
+
     # Calculate overall fit score using weighted average
     overall_fit_score = 0.0
     total_weight = 0.0
 
     for category in rubric.categories:
         category_weight = category.weight
-        avg_score = _calculate_weighted_average_score(category.name, panel_reviews)
+        avg_score = _calculate_weighted_average_score(category.name, score_index)
 
         overall_fit_score += category_weight * avg_score
         total_weight += category_weight
 
-        logger.debug(f"Category '{category.name}': avg_score={avg_score:.2f}, weight={category_weight}")
+        logger.debug("Category '%s': avg_score=%.2f, weight=%s", category.name, avg_score, category_weight)
 
     if total_weight > 0:
         overall_fit_score = round(overall_fit_score / total_weight, 1)
 
-    logger.info(f"Calculated overall fit score: {overall_fit_score}")
+    logger.info("Calculated overall fit score: %s", overall_fit_score)
 
     # Determine confidence level
     num_disagreements = len(disagreements)
@@ -274,7 +294,7 @@ def _create_decision_packet(
     else:
         confidence = "low"
 
-    logger.debug(f"Confidence level: {confidence} ({num_disagreements} disagreements)")
+    logger.debug("Confidence level: %s (%s disagreements)", confidence, num_disagreements)
 
     # Aggregate top strengths
     all_strengths = []
@@ -282,7 +302,7 @@ def _create_decision_packet(
         all_strengths.extend(review.top_strengths)
 
     top_strengths = _deduplicate_strengths_risks(all_strengths)
-    logger.debug(f"Aggregated {len(top_strengths)} top strengths")
+    logger.debug("Aggregated %s top strengths", len(top_strengths))
 
     # Aggregate top risks
     all_risks = []
@@ -290,20 +310,20 @@ def _create_decision_packet(
         all_risks.extend(review.top_risks)
 
     top_risks = _deduplicate_strengths_risks(all_risks)
-    logger.debug(f"Aggregated {len(top_risks)} top risks")
+    logger.debug("Aggregated %s top risks", len(top_risks))
 
     # Identify must-have gaps
     must_have_gaps = []
     for category in rubric.categories:
         if category.is_must_have:
-            avg_score = _calculate_weighted_average_score(category.name, panel_reviews)
+            avg_score = _calculate_weighted_average_score(category.name, score_index)
             if avg_score < 3.0:
                 gap_description = (
                     f"Must-have category '{category.name}' scored below threshold "
                     f"(avg: {avg_score:.1f}/5.0)"
                 )
                 must_have_gaps.append(gap_description)
-                logger.warning(f"Must-have gap detected: {gap_description}")
+                logger.warning("Must-have gap detected: %s", gap_description)
 
     # Determine recommendation
     if overall_fit_score >= 4.0 and not must_have_gaps:
@@ -318,7 +338,7 @@ def _create_decision_packet(
     else:
         recommendation = None  # Withhold recommendation pending interview
 
-    logger.info(f"Recommendation: {recommendation}")
+    logger.info("Recommendation: %s", recommendation)
 
     # Create decision packet
     decision_packet = DecisionPacket(
@@ -339,7 +359,8 @@ def _create_interview_plan(
     rubric: Rubric,
     panel_reviews: List[AgentReview],
     disagreements: List[Disagreement],
-    agent_working_memory: Dict[str, WorkingMemory]
+    agent_working_memory: Dict[str, WorkingMemory],
+    score_index: Optional[ScoreIndex] = None
 ) -> InterviewPlan:
     """
     Generate an interview plan with role-specific questions.
@@ -355,12 +376,16 @@ def _create_interview_plan(
         panel_reviews: List of agent reviews
         disagreements: List of disagreements
         agent_working_memory: Agent working memory
+        score_index: Precomputed category score index (built from panel_reviews if omitted)
 
     Returns:
         InterviewPlan with questions by interviewer
     """
     logger.debug("Creating interview plan")
 
+    if score_index is None:
+        score_index = _build_score_index(panel_reviews)
+
     # Initialize questions by interviewer
     questions_by_interviewer: Dict[str, List[InterviewQuestion]] = {}
 
@@ -369,30 +394,31 @@ def _create_interview_plan(
     for role in agent_roles:
         questions_by_interviewer[role] = []
 
+    # Remaining question slots per interviewer; questions are only built while a slot is free
+    quota = {role: 7 for role in agent_roles}
+
     # Track priority areas
     priority_areas = []
 
     # 1. Generate questions from must-have gaps
     for category in rubric.categories:
         if category.is_must_have:
-            avg_score = _calculate_weighted_average_score(category.name, panel_reviews)
+            avg_score = _calculate_weighted_average_score(category.name, score_index)
             if avg_score < 3.0:
                 priority_areas.append(category.name)
 
-                # Assign to most relevant interviewer
-                for review in panel_reviews:
-                    for score_item in review.category_scores:
-                        if score_item.category_name == category.name and score_item.score < 3:
-                            question = InterviewQuestion(
-                                question=f"This role requires strong {category.name}. Can you walk me through specific examples where you've demonstrated this?",
-                                category=category.name,
-                                interviewer_role=review.agent_role,
-                                what_to_listen_for=["Concrete examples", "Measurable outcomes", "Clear ownership", "Technical depth"],
-                                red_flags=["Vague responses", "Lack of specifics", "Team achievements without personal contribution"]
-                            )
-                            if len(questions_by_interviewer[review.agent_role]) < 7:
-                                questions_by_interviewer[review.agent_role].append(question)
-                            break
+                # Assign to each interviewer whose agent scored the category low
+                for agent_role, score in score_index.get(category.name, {}).items():
+                    if score < 3 and quota[agent_role]:
+                        question = InterviewQuestion(
+                            question=f"This role requires strong {category.name}. Can you walk me through specific examples where you've demonstrated this?",
+                            category=category.name,
+                            interviewer_role=agent_role,
+                            what_to_listen_for=["Concrete examples", "Measurable outcomes", "Clear ownership", "Technical depth"],
+                            red_flags=["Vague responses", "Lack of specifics", "Team achievements without personal contribution"]
+                        )
+                        questions_by_interviewer[agent_role].append(question)
+                        quota[agent_role] -= 1
 
     # 2. Generate questions from disagreements
     for disagreement in disagreements:
@@ -403,6 +429,9 @@ def _create_interview_plan(
         lowest_score = min(disagreement.agent_scores.values())
         lowest_agent = [role for role, score in disagreement.agent_scores.items() if score == lowest_score][0]
 
+        if not quota[lowest_agent]:
+            continue
+
         question = InterviewQuestion(
             question=f"Tell me about your experience with {category_name}. What's your approach and what results have you achieved?",
             category=category_name,
@@ -410,17 +439,18 @@ def _create_interview_plan(
             what_to_listen_for=["Detailed examples", "Specific metrics", "Clear methodology", "Lessons learned"],
             red_flags=["Inconsistent with resume", "Surface-level understanding", "Unable to discuss trade-offs"]
         )
-
-        if len(questions_by_interviewer[lowest_agent]) < 7:
-            questions_by_interviewer[lowest_agent].append(question)
+        questions_by_interviewer[lowest_agent].append(question)
+        quota[lowest_agent] -= 1
 
     # 3. Generate questions from working memory (ambiguities, gaps, contradictions)
     for agent_role, memory in agent_working_memory.items():
-        if agent_role not in questions_by_interviewer:
+        if not quota.get(agent_role):
             continue
 
         # From ambiguities
         for ambiguity in memory.ambiguities[:2]:  # Limit to 2
+            if not quota[agent_role]:
+                break
             question = InterviewQuestion(
                 question=f"Can you clarify: {ambiguity}?",
                 category="Clarification",
@@ -428,11 +458,13 @@ def _create_interview_plan(
                 what_to_listen_for=["Specific examples", "Clear ownership", "Concrete details", "Timeline"],
                 red_flags=["Vague answers", "Deflection", "Inconsistency with resume"]
             )
-            if len(questions_by_interviewer[agent_role]) < 7:
-                questions_by_interviewer[agent_role].append(question)
+            questions_by_interviewer[agent_role].append(question)
+            quota[agent_role] -= 1
 
         # From missing information
         for missing_info in memory.missing_information[:2]:  # Limit to 2
+            if not quota[agent_role]:
+                break
             question = InterviewQuestion(
                 question=f"I noticed your resume doesn't mention {missing_info}. Can you speak to your experience in this area?",
                 category="Gap Exploration",
@@ -440,8 +472,8 @@ def _create_interview_plan(
                 what_to_listen_for=["Honest acknowledgment", "Related experience", "Learning approach", "Transferable skills"],
                 red_flags=["Defensive response", "Exaggeration", "Avoidance", "Overconfidence"]
             )
-            if len(questions_by_interviewer[agent_role]) < 7:
-                questions_by_interviewer[agent_role].append(question)
+            questions_by_interviewer[agent_role].append(question)
+            quota[agent_role] -= 1
 
         # From contradictions (using cross_references with contradictory assessment)
         contradictory_refs = [
@@ -449,6 +481,8 @@ def _create_interview_plan(
             if ref.assessment == "contradictory" or (ref.contradictory_evidence and len(ref.contradictory_evidence) > 0)
         ]
         for ref in contradictory_refs[:1]:  # Limit to 1
+            if not quota[agent_role]:
+                break
             question = InterviewQuestion(
                 question=f"Your resume states '{ref.claim}'. Can you walk me through specific examples?",
                 category="Claim Verification",
@@ -456,18 +490,18 @@ def _create_interview_plan(
                 what_to_listen_for=["Detailed timeline", "Specific metrics", "Clear outcomes", "Consistency"],
                 red_flags=["Lack of specifics", "Timeline mismatch", "Backtracking", "Contradictory details"]
             )
-            if len(questions_by_interviewer[agent_role]) < 7:
-                questions_by_interviewer[agent_role].append(question)
+            questions_by_interviewer[agent_role].append(question)
+            quota[agent_role] -= 1
 
     # Calculate time estimate (15 minutes per interviewer)
     total_questions = sum(len(questions) for questions in questions_by_interviewer.values())
     time_estimate_minutes = len(questions_by_interviewer) * 15
 
-    logger.info(f"Generated {total_questions} interview questions across {len(questions_by_interviewer)} interviewers")
-    logger.debug(f"Estimated interview time: {time_estimate_minutes} minutes")
+    logger.info("Generated %s interview questions across %s interviewers", total_questions, len(questions_by_interviewer))
+    logger.debug("Estimated interview time: %s minutes", time_estimate_minutes)
 
-    # Deduplicate priority areas
-    priority_areas = list(set(priority_areas))
+    # Deduplicate priority areas, keeping first-seen order
+    priority_areas = list(dict.fromkeys(priority_areas))
 
     interview_plan = InterviewPlan(
         questions_by_interviewer=questions_by_interviewer,
@@ -514,15 +548,23 @@ def synthesis_node(state: HiringWorkflowState) -> Dict:
         if not agent_working_memory:
             logger.warning("No agent working memory found - synthesis will run in degraded mode")
 
-        logger.info(f"Processing {len(panel_reviews)} panel reviews")
+        logger.info("Processing %s panel reviews", len(panel_reviews))
 
-        # Step 1: Detect disagreements
-        logger.info("Step 1: Detecting disagreements")
-        disagreements = _detect_disagreements(panel_reviews, rubric)
+        # Index scores once for all synthesis steps
+        score_index = _build_score_index(panel_reviews)
+
+        if len(panel_reviews) == 1:
+            # A single reviewer cannot disagree with anyone, so skip steps 1-2
+            logger.info("Single panel review - skipping disagreement detection")
+            disagreements = []
+        else:
+            # Step 1: Detect disagreements
+            logger.info("Step 1: Detecting disagreements")
+            disagreements = _detect_disagreements(panel_reviews, rubric, score_index)
 
-        # Step 2: Enrich disagreements with working memory
-        logger.info("Step 2: Enriching disagreements with working memory")
-        disagreements = _enrich_disagreements_with_memory(disagreements, agent_working_memory)
+            # Step 2: Enrich disagreements with working memory
+            logger.info("Step 2: Enriching disagreements with working memory")
+            disagreements = _enrich_disagreements_with_memory(disagreements, agent_working_memory)
 
         # Step 3: Create decision packet
         logger.info("Step 3: Creating decision packet")
@@ -530,7 +572,8 @@ def synthesis_node(state: HiringWorkflowState) -> Dict:
             rubric,
             panel_reviews,
             disagreements,
-            agent_working_memory
+            agent_working_memory,
+            score_index
         )
 
         # Step 4: Create interview plan
@@ -539,16 +582,17 @@ def synthesis_node(state: HiringWorkflowState) -> Dict:
             rubric,
             panel_reviews,
             disagreements,
-            agent_working_memory
+            agent_working_memory,
+            score_index
         )
 
         # Log summary
-        logger.info(f"Synthesis complete:")
-        logger.info(f"  - Disagreements: {len(disagreements)}")
-        logger.info(f"  - Overall fit score: {decision_packet.overall_fit_score}")
-        logger.info(f"  - Confidence: {decision_packet.confidence}")
-        logger.info(f"  - Recommendation: {decision_packet.recommendation}")
-        logger.info(f"  - Interview questions: {sum(len(q) for q in interview_plan.questions_by_interviewer.values())}")
+        logger.info("Synthesis complete:")
+        logger.info("  - Disagreements: %s", len(disagreements))
+        logger.info("  - Overall fit score: %s", decision_packet.overall_fit_score)
+        logger.info("  - Confidence: %s", decision_packet.confidence)
+        logger.info("  - Recommendation: %s", decision_packet.recommendation)
+        logger.info("  - Interview questions: %s", sum(len(q) for q in interview_plan.questions_by_interviewer.values()))
 
         # Return state update
         return {
@@ -558,5 +602,5 @@ def synthesis_node(state: HiringWorkflowState) -> Dict:
         }
 
     except Exception as e:
-        logger.error(f"Error in synthesis node: {str(e)}", exc_info=True)
+        logger.error("Error in synthesis node: %s", e, exc_info=True)
         raise
@@ -4,20 +4,19 @@ This module contains prompts used by panel agents to:
 - Extract working memory (observations, cross-references, timeline, gaps)
 - Perform rubric-based evaluation using working memory context
 - Generate role-specific assessments (HR, Tech, Compliance)
+
+Each prompt is split into a static system prompt (instructions and output
+format) and an input prompt (resume, rubric, working memory). Agents send them
+as separate messages so providers can cache the static prefix across calls.
+Evaluation inputs put the rubric, shared by every candidate for a job, ahead
+of the per-candidate resume and working memory. The combined `*_PROMPT`
+constants join both parts into a single template.
 """
 
-WORKING_MEMORY_EXTRACTION_PROMPT = """You are a {agent_role} agent performing systematic resume analysis for a hiring panel.
+WORKING_MEMORY_EXTRACTION_SYSTEM_PROMPT = """You are a {agent_role} agent performing systematic resume analysis for a hiring panel.
 
 Your task is to extract working memory by carefully reading the resume and creating structured observations that will inform your evaluation in the next pass.
 
-## Resume
-
-{resume}
-
-## Rubric Categories to Analyze
-
-{categories}
-
 ## Working Memory Structure
 
 Extract the following information:
@@ -194,30 +193,45 @@ Return a valid WorkingMemory JSON object with the following structure:
 Focus on creating thorough, evidence-based working memory that will enable accurate scoring in the evaluation pass.
 """
 
-HR_EVALUATION_PROMPT = """You are an HR agent on a hiring panel evaluating a candidate's resume.
+WORKING_MEMORY_EXTRACTION_INPUT_PROMPT = """## Resume
 
-**CRITICAL**: You must evaluate the candidate against the EXACT rubric categories provided below. Do NOT create your own categories.
-
-Your HR perspective means you evaluate each rubric category through an HR lens:
-- **Seniority signals**: Does the candidate's experience match their claimed level?
-- **Leadership & collaboration**: Evidence of team leadership, mentorship, cross-functional work
-- **Communication clarity**: Is the resume well-written, clear, and professional?
-- **Career trajectory**: Does the progression make sense? Any red flags?
-- **Cultural fit indicators**: Alignment with company values, work style, domain interest
+{resume}
 
-**These are NOT separate categories to score**. These are the HR concerns you should consider when evaluating each rubric category.
+## Rubric Categories to Analyze
 
-## Resume
+{categories}
+"""
 
-{resume}
+WORKING_MEMORY_EXTRACTION_PROMPT = WORKING_MEMORY_EXTRACTION_SYSTEM_PROMPT + "\n" + WORKING_MEMORY_EXTRACTION_INPUT_PROMPT
 
-## Evaluation Rubric
+EVALUATION_RUBRIC_PROMPT = """## Evaluation Rubric
 
 {rubric}
+"""
+
+EVALUATION_CANDIDATE_PROMPT = """## Resume
+
+{resume}
 
 ## Working Memory (From First Pass)
 
 {working_memory}
+"""
+
+EVALUATION_INPUT_PROMPT = EVALUATION_RUBRIC_PROMPT + "\n" + EVALUATION_CANDIDATE_PROMPT
+
+HR_EVALUATION_SYSTEM_PROMPT = """You are an HR agent on a hiring panel evaluating a candidate's resume.
+
+**CRITICAL**: You must evaluate the candidate against the EXACT rubric categories provided below. Do NOT create your own categories.
+
+Your HR perspective means you evaluate each rubric category through an HR lens:
+- **Seniority signals**: Does the candidate's experience match their claimed level?
+- **Leadership & collaboration**: Evidence of team leadership, mentorship, cross-functional work
+- **Communication clarity**: Is the resume well-written, clear, and professional?
+- **Career trajectory**: Does the progression make sense? Any red flags?
+- **Cultural fit indicators**: Alignment with company values, work style, domain interest
+
+**These are NOT separate categories to score**. These are the HR concerns you should consider when evaluating each rubric category.
 
 ## Instructions
 
@@ -225,7 +239,7 @@ Using the working memory observations as your evidence base, evaluate the candid
 
 ### Step 1: Score Each Category **FROM THE RUBRIC**
 
-**CRITICAL**: You MUST score every category that appears in the rubric above. Use the EXACT category names from the rubric. Do NOT create new categories.
+**CRITICAL**: You MUST score every category that appears in the rubric. Use the EXACT category names from the rubric. Do NOT create new categories.
 
 For each category in the rubric:
 1. Review the working memory observations related to this category
@@ -305,7 +319,7 @@ Return a valid AgentReview JSON object:
   "agent_role": "HR",
   "category_scores": [
     {{
-      "category_name": "Copy the EXACT category name from the rubric above - do not modify it",
+      "category_name": "Copy the EXACT category name from the rubric - do not modify it",
       "score": 4,
       "evidence": [
         {{
@@ -341,14 +355,16 @@ Return a valid AgentReview JSON object:
 ```
 
 **Critical Requirements**:
-1. **USE EXACT RUBRIC CATEGORY NAMES**: Your category_scores must use the EXACT category names from the rubric provided above. Do NOT create new categories or rename them.
+1. **USE EXACT RUBRIC CATEGORY NAMES**: Your category_scores must use the EXACT category names from the rubric provided. Do NOT create new categories or rename them.
 2. **SCORE ALL RUBRIC CATEGORIES**: You must score every single category that appears in the rubric. Missing categories will cause validation errors.
 3. Each category_score must include at least 1 evidence object with all three fields: resume_text, line_reference, interpretation
 4. Include the gaps array for each category (empty array [] if no gaps)
 5. Include confidence level for each category: "high", "medium", or "low"
 """
 
-TECH_EVALUATION_PROMPT = """You are a Technical agent on a hiring panel evaluating a candidate's resume.
+HR_EVALUATION_PROMPT = HR_EVALUATION_SYSTEM_PROMPT + "\n" + EVALUATION_INPUT_PROMPT
+
+TECH_EVALUATION_SYSTEM_PROMPT = """You are a Technical agent on a hiring panel evaluating a candidate's resume.
 
 **CRITICAL**: You must evaluate the candidate against the EXACT rubric categories provided below. Do NOT create your own categories.
 
@@ -361,25 +377,13 @@ Your technical perspective means you evaluate each rubric category through a tec
 
 **These are NOT separate categories to score**. These are the technical concerns you should consider when evaluating each rubric category.
 
-## Resume
-
-{resume}
-
-## Evaluation Rubric
-
-{rubric}
-
-## Working Memory (From First Pass)
-
-{working_memory}
-
 ## Instructions
 
 Using the working memory observations as your evidence base, evaluate the candidate against each rubric category:
 
 ### Step 1: Score Each Category **FROM THE RUBRIC**
 
-**CRITICAL**: You MUST score every category that appears in the rubric above. Use the EXACT category names from the rubric. Do NOT create new categories.
+**CRITICAL**: You MUST score every category that appears in the rubric. Use the EXACT category names from the rubric. Do NOT create new categories.
 
 For each category in the rubric:
 1. Review the working memory observations related to this category
@@ -471,7 +475,7 @@ Return a valid AgentReview JSON object:
   "agent_role": "Tech",
   "category_scores": [
     {{
-      "category_name": "Copy the EXACT category name from the rubric above - do not modify it",
+      "category_name": "Copy the EXACT category name from the rubric - do not modify it",
       "score": 4,
       "evidence": [
         {{
@@ -515,7 +519,9 @@ Return a valid AgentReview JSON object:
 **Avoid over-rating toy demos**: Be rigorous in distinguishing between tutorial projects and production systems. Look for scale, monitoring, and real-world impact.
 """
 
-COMPLIANCE_EVALUATION_PROMPT = """You are a Compliance agent on a hiring panel evaluating a candidate's resume.
+TECH_EVALUATION_PROMPT = TECH_EVALUATION_SYSTEM_PROMPT + "\n" + EVALUATION_INPUT_PROMPT
+
+COMPLIANCE_EVALUATION_SYSTEM_PROMPT = """You are a Compliance agent on a hiring panel evaluating a candidate's resume.
 
 **CRITICAL**: You must evaluate the candidate against the EXACT rubric categories provided below. Do NOT create your own categories.
 
@@ -535,25 +541,13 @@ For example, if a rubric category is "LLM Integration & Optimization", you evalu
 
 **Important**: This is a risk review, not legal advice. You're assessing awareness and practices, not providing legal guidance.
 
-## Resume
-
-{resume}
-
-## Evaluation Rubric
-
-{rubric}
-
-## Working Memory (From First Pass)
-
-{working_memory}
-
 ## Instructions
 
 Using the working memory observations as your evidence base, evaluate the candidate against each rubric category:
 
 ### Step 1: Score Each Category **FROM THE RUBRIC**
 
-**CRITICAL**: You MUST score every category that appears in the rubric above. Use the EXACT category names from the rubric. Do NOT create new categories.
+**CRITICAL**: You MUST score every category that appears in the rubric. Use the EXACT category names from the rubric. Do NOT create new categories.
 
 For each category in the rubric:
 1. Review the working memory observations related to compliance/security/privacy
@@ -645,7 +639,7 @@ Return a valid AgentReview JSON object:
   "agent_role": "Compliance",
   "category_scores": [
     {{
-      "category_name": "Copy the EXACT category name from the rubric above - do not modify it",
+      "category_name": "Copy the EXACT category name from the rubric - do not modify it",
       "score": 3,
       "evidence": [
         {{
@@ -688,3 +682,5 @@ Return a valid AgentReview JSON object:
 
 **Note**: Focus on identifying risks and verifying awareness, not on providing legal advice or making final compliance determinations.
 """
+
+COMPLIANCE_EVALUATION_PROMPT = COMPLIANCE_EVALUATION_SYSTEM_PROMPT + "\n" + EVALUATION_INPUT_PROMPT
@@ -15,23 +15,23 @@ import sys
 from pathlib import Path
 from typing import List, Tuple
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add backend to path so imports resolve to the same src.* modules as the app
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from models.rubric import Rubric
-from models.memory import WorkingMemory
-from models.review import AgentReview
-from prompts.orchestrator_prompts import (
+from src.models.rubric import Rubric
+from src.models.memory import WorkingMemory
+from src.models.review import AgentReview
+from src.prompts.orchestrator_prompts import (
     RUBRIC_GENERATION_PROMPT,
     RUBRIC_VALIDATION_PROMPT,
 )
-from prompts.agent_prompts import (
+from src.prompts.agent_prompts import (
     WORKING_MEMORY_EXTRACTION_PROMPT,
     HR_EVALUATION_PROMPT,
     TECH_EVALUATION_PROMPT,
     COMPLIANCE_EVALUATION_PROMPT,
 )
-from utils.prompt_helpers import (
+from src.utils.prompt_helpers import (
     validate_prompt_placeholders,
     get_missing_placeholders,
     format_rubric_for_prompt,
@@ -15,7 +15,8 @@ Initial State:
     ↓ [Orchestrator Node]
 
 After Orchestrator:
-└─ rubric (Rubric) ← Generated evaluation framework
+├─ rubric (Rubric) ← Generated evaluation framework
+└─ rubric_json (str) ← Rubric serialized once for panel agent prompts
 
     ↓ [Panel Agents - Parallel Execution]
 
@@ -110,6 +111,7 @@ class HiringWorkflowState(TypedDict, total=False):
 
     **After Orchestrator Node:**
     - rubric: Generated evaluation framework with categories and scoring bands
+    - rubric_json: Rubric serialized once for reuse in panel agent prompts
 
     **After Panel Agents (parallel execution):**
     - panel_reviews: One AgentReview per agent (HR, Tech, Compliance, optionally Product)
@@ -147,6 +149,13 @@ class HiringWorkflowState(TypedDict, total=False):
     Created by orchestrator based on job description and company context.
     """
 
+    rubric_json: str
+    """
+    Rubric serialized to JSON once by the orchestrator.
+    Panel agents embed this in their evaluation prompts instead of
+    re-serializing the rubric per agent.
+    """
+
     # ==================== Panel Agent Outputs ====================
     # Populated by parallel panel agent execution
 
@@ -5,7 +5,12 @@ This package contains helper functions for LLM operations, prompt management,
 and validation.
 """
 
-from .llm import get_structured_llm
+from .llm import (
+    ainvoke_structured,
+    build_prompt_messages,
+    clear_structured_llm_cache,
+    get_structured_llm,
+)
 from .prompt_helpers import (
     format_rubric_for_prompt,
 )
@@ -18,6 +23,9 @@ from .validators import (
 
 __all__ = [
     "get_structured_llm",
+    "clear_structured_llm_cache",
+    "ainvoke_structured",
+    "build_prompt_messages",
     "format_rubric_for_prompt",
     "validate_rubric_completeness",
     "validate_rubric_quality",
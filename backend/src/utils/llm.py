@@ -4,18 +4,35 @@ This module provides centralized LLM configuration with Pydantic model binding
 for type-safe, validated responses across all workflow nodes.
 """
 
-from typing import Type, TypeVar, Union
+import asyncio
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar, Union
 
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from pydantic import BaseModel
 
-from config import get_settings
+from src.config import get_settings
+
+if TYPE_CHECKING:
+    # Provider SDKs are imported on first use; only the configured one is loaded
+    from langchain_anthropic import ChatAnthropic
+    from langchain_openai import ChatOpenAI
 
 T = TypeVar('T', bound=BaseModel)
 
+# Structured LLM instances keyed by Pydantic model class; populated under the lock
+_structured_llm_cache: Dict[type, Union["ChatOpenAI", "ChatAnthropic"]] = {}
+_structured_llm_lock = threading.Lock()
+
+# One concurrency limiter per event loop, since asyncio semaphores are loop-bound
+_llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
-def get_structured_llm(pydantic_model: Type[T]) -> Union[ChatOpenAI, ChatAnthropic]:
+def get_structured_llm(pydantic_model: Type[T]) -> Union["ChatOpenAI", "ChatAnthropic"]:
     """Get a configured LLM instance with structured output binding.
 
     This function creates an LLM instance configured according to the
@@ -24,6 +41,12 @@ def get_structured_llm(pydantic_model: Type[T]) -> Union[ChatOpenAI, ChatAnthrop
 
     Supports OpenAI, Anthropic Claude, and llama.cpp server providers.
 
+    Instances are cached per Pydantic model class, so the structured-output
+    schema is built once per process rather than on every node invocation.
+    The first build for a model happens under a lock, so concurrent workflows
+    (e.g. sync nodes running in LangGraph's thread pool) build it only once.
+    Call `clear_structured_llm_cache()` after changing settings.
+
     Args:
         pydantic_model: Pydantic model class defining the expected output schema.
             The LLM will be constrained to return responses matching this schema.
@@ -37,16 +60,109 @@ def get_structured_llm(pydantic_model: Type[T]) -> Union[ChatOpenAI, ChatAnthrop
         ValueError: If the LLM provider is invalid or required API keys are missing.
 
     Examples:
-        >>> from backend.src.models.review import Rubric
+        >>> from src.models.rubric import Rubric
         >>> llm = get_structured_llm(Rubric)
         >>> result = llm.invoke("Generate a rubric for Senior Backend Engineer")
         >>> assert isinstance(result, Rubric)
 
-        >>> from backend.src.models.memory import WorkingMemory
+        >>> from src.models.memory import WorkingMemory
         >>> llm = get_structured_llm(WorkingMemory)
         >>> result = llm.invoke(prompt)
         >>> assert isinstance(result, WorkingMemory)
     """
+    structured_llm = _structured_llm_cache.get(pydantic_model)
+    if structured_llm is None:
+        with _structured_llm_lock:
+            structured_llm = _structured_llm_cache.get(pydantic_model)
+            if structured_llm is None:
+                structured_llm = _create_structured_llm(pydantic_model)
+                _structured_llm_cache[pydantic_model] = structured_llm
+
+    return structured_llm
+
+
+def build_prompt_messages(
+    system_prompt: str,
+    user_prompt: str,
+    shared_prompt: Optional[str] = None,
+) -> List[BaseMessage]:
+    """Build a system + user message pair with the static prompt first.
+
+    Providers cache prompt prefixes: OpenAI does so automatically for identical
+    leading tokens, and Anthropic caches blocks marked with `cache_control`.
+    Keeping the static instructions in the system message and the per-request
+    inputs in the user message lets repeated calls reuse the cached prefix.
+
+    Args:
+        system_prompt: Static instructions shared across requests
+        user_prompt: Per-request inputs (resume, rubric, working memory)
+        shared_prompt: Inputs shared by many requests (e.g. the rubric for a
+            job), placed ahead of `user_prompt` behind their own cache
+            breakpoint
+
+    Returns:
+        Messages ready to pass to a structured LLM's `invoke`/`ainvoke`
+    """
+    if get_settings().llm_provider == "anthropic":
+        system_message = SystemMessage(content=[
+            {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+        ])
+        if shared_prompt is not None:
+            user_message = HumanMessage(content=[
+                {"type": "text", "text": shared_prompt, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": user_prompt},
+            ])
+            return [system_message, user_message]
+    else:
+        system_message = SystemMessage(content=system_prompt)
+
+    if shared_prompt is not None:
+        user_prompt = f"{shared_prompt}\n{user_prompt}"
+    return [system_message, HumanMessage(content=user_prompt)]
+
+
+async def ainvoke_structured(llm: Any, prompt: LanguageModelInput) -> Any:
+    """Invoke a structured LLM asynchronously, bounded by `llm_max_concurrency`.
+
+    Callers should schedule independent calls together (e.g. with
+    `asyncio.gather`) and let the semaphore limit how many reach the provider
+    at once, rather than awaiting each call before issuing the next.
+
+    Args:
+        llm: Structured LLM from `get_structured_llm`
+        prompt: Fully formatted prompt or messages from `build_prompt_messages`
+
+    Returns:
+        Parsed structured output from the LLM
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_settings().llm_max_concurrency)
+        _llm_semaphores[loop] = semaphore
+
+    async with semaphore:
+        return await llm.ainvoke(prompt)
+
+
+def clear_structured_llm_cache() -> None:
+    """Drop cached structured LLM instances so the next call rebuilds them."""
+    with _structured_llm_lock:
+        _structured_llm_cache.clear()
+
+
+def _create_structured_llm(pydantic_model: Type[T]) -> Union["ChatOpenAI", "ChatAnthropic"]:
+    """Build a new LLM instance from settings and bind it to the Pydantic model.
+
+    Args:
+        pydantic_model: Pydantic model class defining the expected output schema
+
+    Returns:
+        LLM instance with structured output bound to `pydantic_model`
+
+    Raises:
+        ValueError: If the LLM provider is invalid or required API keys are missing.
+    """
     settings = get_settings()
 
     # Validate provider configuration
@@ -58,6 +174,8 @@ def get_structured_llm(pydantic_model: Type[T]) -> Union[ChatOpenAI, ChatAnthrop
             )
 
         # Configure OpenAI provider
+        from langchain_openai import ChatOpenAI
+
         llm = ChatOpenAI(
             model=settings.openai_model_name,
             temperature=settings.temperature,
@@ -73,6 +191,8 @@ def get_structured_llm(pydantic_model: Type[T]) -> Union[ChatOpenAI, ChatAnthrop
             )
 
         # Configure Anthropic provider
+        from langchain_anthropic import ChatAnthropic
+
         llm = ChatAnthropic(
             model=settings.anthropic_model_name,
             temperature=settings.temperature,
@@ -82,6 +202,8 @@ def get_structured_llm(pydantic_model: Type[T]) -> Union[ChatOpenAI, ChatAnthrop
 
     elif settings.llm_provider == "llamacpp-server":
         # Configure llama.cpp server provider with OpenAI-compatible API
+        from langchain_openai import ChatOpenAI
+
         llm = ChatOpenAI(
             base_url=settings.llamacpp_base_url,
             api_key=settings.llamacpp_api_key,
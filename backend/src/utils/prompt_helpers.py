@@ -5,10 +5,12 @@ prompt strings, validate prompt templates, and extract information for use in
 prompt construction.
 """
 
+import re
+import unicodedata
 from typing import List
 
-from models.rubric import Rubric
-from models.memory import WorkingMemory
+from src.models.rubric import Rubric
+from src.models.memory import WorkingMemory
 
 
 def format_rubric_for_prompt(rubric: Rubric) -> str:
@@ -24,7 +26,7 @@ def format_rubric_for_prompt(rubric: Rubric) -> str:
         Formatted rubric string with categories, weights, and scoring criteria
 
     Example:
-        >>> from backend.src.models.rubric import Rubric
+        >>> from src.models.rubric import Rubric
         >>> rubric = Rubric(role_title="Senior Engineer", categories=[...])
         >>> formatted = format_rubric_for_prompt(rubric)
         >>> print(formatted)
@@ -76,7 +78,7 @@ def format_working_memory_for_prompt(memory: WorkingMemory) -> str:
         Formatted working memory string with all observations and analysis
 
     Example:
-        >>> from backend.src.models.memory import WorkingMemory
+        >>> from src.models.memory import WorkingMemory
         >>> memory = WorkingMemory(agent_role="Tech", key_observations=[...])
         >>> formatted = format_working_memory_for_prompt(memory)
         >>> print(formatted)
@@ -165,7 +167,7 @@ def extract_categories_list(rubric: Rubric) -> List[str]:
         List of category names
 
     Example:
-        >>> from backend.src.models.rubric import Rubric
+        >>> from src.models.rubric import Rubric
         >>> rubric = Rubric(role_title="Senior Engineer", categories=[...])
         >>> categories = extract_categories_list(rubric)
         >>> print(categories)
@@ -187,7 +189,7 @@ def format_categories_for_prompt(rubric: Rubric) -> str:
         Formatted string with bulleted category list
 
     Example:
-        >>> from backend.src.models.rubric import Rubric
+        >>> from src.models.rubric import Rubric
         >>> rubric = Rubric(role_title="Senior Engineer", categories=[...])
         >>> formatted = format_categories_for_prompt(rubric)
         >>> print(formatted)
@@ -279,6 +281,33 @@ def get_missing_placeholders(template: str, required_keys: List[str]) -> List[st
     return sorted(list(missing))
 
 
+_TRAILING_WHITESPACE = re.compile(r"[ \t]+$", re.MULTILINE)
+
+
+def canonicalize_prompt_text(text: str) -> str:
+    """Normalize free text before interpolating it into a prompt.
+
+    Cosmetic differences (line endings, trailing spaces, Unicode composition,
+    surrounding blank lines) change the prompt bytes without changing its
+    meaning, which defeats exact-match response caching and provider prefix
+    caching. Canonicalizing makes such variants produce identical prompts.
+
+    Args:
+        text: Free text such as a resume or job description
+
+    Returns:
+        NFC-normalized text with `\n` line endings, no trailing whitespace on
+        any line, and no leading or trailing blank lines
+
+    Example:
+        >>> canonicalize_prompt_text("Jane Doe  \r\nEngineer\r\n\r\n")
+        'Jane Doe\nEngineer'
+    """
+    text = unicodedata.normalize("NFC", text)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return _TRAILING_WHITESPACE.sub("", text).strip("\n")
+
+
 def format_agent_review_simple(review) -> str:
     """Format AgentReview object into simple readable summary.
 
@@ -292,7 +321,7 @@ def format_agent_review_simple(review) -> str:
         Formatted review summary string
 
     Example:
-        >>> from backend.src.models.review import AgentReview
+        >>> from src.models.review import AgentReview
         >>> review = AgentReview(agent_role="Tech", ...)
         >>> formatted = format_agent_review_simple(review)
         >>> print(formatted)
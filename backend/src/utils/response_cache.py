@@ -0,0 +1,252 @@
+"""Exact-match response cache for structured LLM calls.
+
+Repeated workflow runs with identical inputs produce identical prompts, so the
+structured response can be reused instead of paying for another LLM call. The
+cache has two tiers:
+- In-memory LRU for hits within a process
+- Optional SQLite table for hits across runs, with per-entry TTL
+
+Entries are keyed by a BLAKE2b digest of the prompt, the output schema name,
+and the configured provider/model, and store the response as JSON so it can
+be rehydrated with `model_validate_json`. For frozen schemas the memory tier
+also keeps the validated instance, so in-process hits skip rehydration.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T', bound=BaseModel)
+
+
+class ResponseCache:
+    """Two-tier (memory LRU + optional SQLite) cache of serialized LLM responses.
+
+    Args:
+        namespace: Identifies the provider/model so responses from different
+            models never share entries
+        max_entries: Maximum number of entries kept in memory
+        ttl_seconds: How long an entry stays valid
+        db_path: SQLite database file for persistence; memory-only if None
+    """
+
+    def __init__(
+        self,
+        namespace: str = "",
+        max_entries: int = 256,
+        ttl_seconds: float = 86400,
+        db_path: Optional[str] = None,
+    ):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory: OrderedDict[str, tuple[float, str, Optional[BaseModel]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses "
+                "(key TEXT PRIMARY KEY, response_json TEXT NOT NULL, ts REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    @property
+    def persistent(self) -> bool:
+        """Whether entries are also stored in SQLite, making lookups blocking I/O."""
+        return self._db is not None
+
+    def make_key(self, prompt: str, schema: Type[BaseModel]) -> str:
+        """Build the cache key for a prompt and output schema.
+
+        Args:
+            prompt: Fully formatted prompt sent to the LLM
+            schema: Pydantic model class the response is parsed into
+
+        Returns:
+            Hex digest identifying the request
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(self.namespace.encode())
+        digest.update(b"\x00")
+        digest.update(schema.__name__.encode())
+        digest.update(b"\x00")
+        digest.update(prompt.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response JSON for a key, or None if absent or expired.
+
+        Args:
+            key: Cache key from `make_key`
+
+        Returns:
+            Serialized response, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                ts, response_json, _ = entry
+                if now - ts <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    return response_json
+                del self._memory[key]
+
+            if self._db is None:
+                return None
+
+            row = self._db.execute(
+                "SELECT response_json, ts FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            response_json, ts = row
+            if now - ts > self.ttl_seconds:
+                self._db.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+
+            self._remember(key, ts, response_json)
+            return response_json
+
+    def get_instance(self, key: str) -> Optional[BaseModel]:
+        """Return the validated instance held in memory for a key, if any.
+
+        Only the memory tier holds instances; SQLite entries may have been
+        written by an older schema, so they always go through `get` and
+        validation.
+
+        Args:
+            key: Cache key from `make_key`
+
+        Returns:
+            Cached model instance, or None on a miss
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            ts, _, instance = entry
+            if instance is None or time.time() - ts > self.ttl_seconds:
+                return None
+            self._memory.move_to_end(key)
+            return instance
+
+    def set(self, key: str, response_json: str, instance: Optional[BaseModel] = None) -> None:
+        """Store a serialized response under a key.
+
+        Args:
+            key: Cache key from `make_key`
+            response_json: Response serialized with `model_dump_json`
+            instance: Validated, immutable instance to keep in memory alongside
+                the JSON
+        """
+        ts = time.time()
+        with self._lock:
+            self._remember(key, ts, response_json, instance)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, response_json, ts) VALUES (?, ?, ?)",
+                    (key, response_json, ts),
+                )
+                self._db.commit()
+
+    def attach_instance(self, key: str, instance: BaseModel) -> None:
+        """Keep a validated instance with an existing in-memory entry.
+
+        Args:
+            key: Cache key whose JSON was just validated into `instance`
+            instance: Validated, immutable instance
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory[key] = (entry[0], entry[1], instance)
+
+    def _remember(
+        self, key: str, ts: float, response_json: str, instance: Optional[BaseModel] = None
+    ) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry when full."""
+        self._memory[key] = (ts, response_json, instance)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+def cached_invoke(llm: Any, prompt: str, schema: Type[T], cache: Optional[ResponseCache]) -> T:
+    """Invoke a structured LLM, reusing a cached response for identical prompts.
+
+    Args:
+        llm: Structured LLM from `get_structured_llm(schema)`
+        prompt: Fully formatted prompt
+        schema: Pydantic model class the LLM returns
+        cache: Response cache, or None to always call the LLM
+
+    Returns:
+        Instance of `schema`, either from the cache or from the LLM. Frozen
+        schemas may return the same instance for repeated hits.
+    """
+    if cache is None:
+        return llm.invoke(prompt)
+
+    key = cache.make_key(prompt, schema)
+    # Frozen instances validated in this process can be shared as-is
+    shareable = bool(schema.model_config.get("frozen"))
+
+    if shareable:
+        instance = cache.get_instance(key)
+        if instance is not None:
+            logger.debug("Response cache instance hit for %s", schema.__name__)
+            return instance
+
+    cached = cache.get(key)
+    if cached is not None:
+        logger.debug("Response cache hit for %s", schema.__name__)
+        result = schema.model_validate_json(cached)
+        if shareable:
+            cache.attach_instance(key, result)
+        return result
+
+    result = llm.invoke(prompt)
+    cache.set(key, result.model_dump_json(), result if shareable else None)
+    return result
+
+
+@lru_cache
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get the process-wide response cache configured from settings.
+
+    Returns:
+        ResponseCache instance, or None if response caching is disabled
+    """
+    settings = get_settings()
+    if not settings.llm_response_cache_enabled:
+        return None
+
+    if settings.llm_provider == "openai":
+        model_name = settings.openai_model_name
+    elif settings.llm_provider == "anthropic":
+        model_name = settings.anthropic_model_name
+    else:
+        model_name = settings.llamacpp_base_url
+
+    return ResponseCache(
+        namespace=f"{settings.llm_provider}:{model_name}:{settings.temperature}",
+        max_entries=settings.llm_response_cache_max_entries,
+        ttl_seconds=settings.llm_response_cache_ttl_seconds,
+        db_path=settings.llm_response_cache_path,
+    )
@@ -5,10 +5,61 @@ This module provides validation functions to ensure generated rubrics
 meet quality standards beyond basic structural validation.
 """
 
-from typing import List, Tuple
+from functools import lru_cache, wraps
+from typing import Callable, List, Tuple
+
 from ..models.rubric import Rubric, RubricCategory
 
+RubricValidator = Callable[[Rubric], Tuple[bool, List[str]]]
+
+_MEMO_MAX_ENTRIES = 64
+
+
+class _RubricContentKey:
+    """Cache key that hashes and compares a rubric by its `content_hash`."""
+
+    __slots__ = ("rubric", "content_hash")
+
+    def __init__(self, rubric: Rubric):
+        self.rubric = rubric
+        self.content_hash = rubric.content_hash
+
+    def __hash__(self) -> int:
+        return hash(self.content_hash)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _RubricContentKey) and self.content_hash == other.content_hash
+
+
+def _memoize_by_rubric_content(validator: RubricValidator) -> RubricValidator:
+    """
+    Cache a rubric validator's result by the rubric's content hash.
+
+    Identical rubrics (e.g. rehydrated from the response cache or regenerated
+    in retry loops) reuse the earlier result instead of re-running the checks.
+    Callers get a fresh issues list on every call.
+
+    Args:
+        validator: Validator accepting a Rubric and returning (is_valid, issues)
+
+    Returns:
+        Memoized validator exposing the underlying LRU's `cache_clear()`
+    """
+    @lru_cache(maxsize=_MEMO_MAX_ENTRIES)
+    def cached(key: _RubricContentKey) -> Tuple[bool, Tuple[str, ...]]:
+        is_valid, issues = validator(key.rubric)
+        return is_valid, tuple(issues)
+
+    @wraps(validator)
+    def wrapper(rubric: Rubric) -> Tuple[bool, List[str]]:
+        is_valid, issues = cached(_RubricContentKey(rubric))
+        return is_valid, list(issues)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
 
+@_memoize_by_rubric_content
 def validate_rubric_quality(rubric: Rubric) -> Tuple[bool, List[str]]:
     """
     Validate the overall quality of rubric content.
@@ -139,6 +190,7 @@ def validate_scoring_criteria_differentiation(category: RubricCategory) -> Tuple
     return (len(issues) == 0, issues)
 
 
+@_memoize_by_rubric_content
 def validate_weight_distribution(rubric: Rubric) -> Tuple[bool, List[str]]:
     """
     Validate that category weights are appropriately distributed.
@@ -190,6 +242,7 @@ def validate_weight_distribution(rubric: Rubric) -> Tuple[bool, List[str]]:
     return (len(issues) == 0, issues)
 
 
+@_memoize_by_rubric_content
 def validate_rubric_completeness(rubric: Rubric) -> Tuple[bool, List[str]]:
     """
     Validate structural completeness of the rubric.
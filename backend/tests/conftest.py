@@ -6,7 +6,6 @@ mocking LLM responses, and helper functions for test assertions.
 """
 
 import pytest
-from datetime import datetime
 from typing import Dict, List, Any
 from unittest.mock import Mock, AsyncMock
 
@@ -15,6 +14,7 @@ from src.models.review import AgentReview, CategoryScore, Evidence
 from src.models.packet import DecisionPacket, Disagreement
 from src.models.interview import InterviewPlan, InterviewQuestion
 from src.models.memory import WorkingMemory, KeyObservation, CrossReference
+from src.models.timestamps import utc_now
 
 
 # ============================================================================
@@ -600,7 +600,7 @@ def sample_state_initial(sample_job_description, sample_resume_strong, sample_co
         "interview_plan": None,
         "disagreements": [],
         "metadata": {
-            "workflow_start_time": datetime.now().isoformat(),
+            "workflow_start_time": utc_now().isoformat(),
             "node_execution_order": [],
         },
     }
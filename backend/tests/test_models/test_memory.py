@@ -368,6 +368,11 @@ class TestWorkingMemory:
         for observation in sample_working_memory.key_observations:
             assert observation.category in rubric_categories
 
+        assert sample_working_memory.validate_against_rubric(sample_rubric) is True
+        assert sample_working_memory.validate_against_rubric(
+            sample_rubric, expected_names=frozenset({"Unrelated Category"})
+        ) is False
+
     def test_cross_references_optional(self):
         """Test that cross_references are optional."""
         memory = WorkingMemory(
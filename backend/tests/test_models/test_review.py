@@ -54,6 +54,36 @@ class TestEvidence:
         assert evidence_copy.resume_text == sample_evidence.resume_text
         assert evidence_copy.interpretation == sample_evidence.interpretation
 
+    def test_evidence_is_frozen_and_hashable(self, sample_evidence):
+        """Test that evidence is immutable and hashes by content."""
+        with pytest.raises(ValidationError):
+            sample_evidence.resume_text = "Changed"
+
+        duplicate = Evidence(**sample_evidence.model_dump())
+        assert hash(duplicate) == hash(sample_evidence)
+        assert len({duplicate, sample_evidence}) == 1
+
+    def test_intern_returns_shared_instance(self):
+        """Test that interning identical citations returns the same object."""
+        first = Evidence.intern(resume_text="Built LangGraph workflows", interpretation="Relevant")
+        second = Evidence.intern(resume_text="Built LangGraph workflows", interpretation="Relevant")
+        other = Evidence.intern(
+            resume_text="Built LangGraph workflows",
+            interpretation="Relevant",
+            line_reference="Experience, 1st bullet",
+        )
+
+        assert first is second
+        assert other is not first
+
+    def test_category_scores_share_validated_evidence(self, sample_category_score):
+        """Test that validating identical citations yields one shared Evidence instance."""
+        payload = sample_category_score.model_dump_json()
+        first = CategoryScore.model_validate_json(payload)
+        second = CategoryScore.model_validate_json(payload)
+
+        assert first.evidence[0] is second.evidence[0]
+
 
 class TestCategoryScore:
     """Tests for CategoryScore model."""
@@ -307,6 +337,19 @@ class TestAgentReview:
             )
         assert ("unexpected" in str(exc_info.value).lower() or "not in" in str(exc_info.value).lower()) and "categor" in str(exc_info.value).lower()
 
+    def test_with_expected_categories(self, sample_hr_review):
+        """Test attaching expected categories checks coverage and returns a copy."""
+        categories = [cs.category_name for cs in sample_hr_review.category_scores]
+        review = sample_hr_review.model_copy(update={"expected_rubric_categories": None})
+
+        updated = review.with_expected_categories(categories)
+        assert updated.expected_rubric_categories == categories
+        assert review.expected_rubric_categories is None
+
+        with pytest.raises(ValueError) as exc_info:
+            review.with_expected_categories(categories + ["Missing Category"])
+        assert "Missing categories" in str(exc_info.value)
+
     def test_get_score_for_category(self, sample_hr_review):
         """Test get_score_for_category helper method."""
         # Find existing category
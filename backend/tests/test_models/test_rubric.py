@@ -4,6 +4,8 @@ Unit tests for rubric models (Rubric, RubricCategory, ScoringCriteria).
 Tests cover validation logic, edge cases, helper methods, and serialization.
 """
 
+from datetime import datetime, timezone
+
 import pytest
 from pydantic import ValidationError
 
@@ -200,6 +202,7 @@ class TestRubric:
         assert len(sample_rubric.categories) == 4
         total_weight = sum(cat.weight for cat in sample_rubric.categories)
         assert abs(total_weight - 1.0) < 0.001  # Floating point tolerance
+        assert sample_rubric.generated_at.tzinfo is timezone.utc
 
     def test_weights_sum_validation(self, sample_scoring_criteria):
         """Test that category weights must sum to 1.0."""
@@ -323,6 +326,9 @@ class TestRubric:
         rubric2 = Rubric(role_title="Test Role", categories=duplicate_categories)
         assert len(rubric2.categories) == 2
 
+        # Lookup by name returns the first matching category
+        assert rubric2.get_category_by_name("Cat1").description == "D1"
+
     def test_json_serialization(self, sample_rubric):
         """Test JSON serialization and deserialization."""
         json_data = sample_rubric.model_dump()
@@ -335,6 +341,42 @@ class TestRubric:
         rubric_copy = Rubric(**json_data)
         assert len(rubric_copy.categories) == len(sample_rubric.categories)
 
+    def test_prompt_json_is_cached(self, sample_rubric):
+        """Test that the prompt JSON is serialized once and reused."""
+        prompt_json = sample_rubric.prompt_json
+
+        assert Rubric.model_validate_json(prompt_json).model_dump() == sample_rubric.model_dump()
+        assert sample_rubric.prompt_json is prompt_json
+        assert "prompt_json" not in sample_rubric.model_dump()
+
+    def test_category_names_helpers(self, sample_rubric):
+        """Test cached category name list and prompt formatting."""
+        names = [category.name for category in sample_rubric.categories]
+
+        assert sample_rubric.category_names == names
+        assert sample_rubric.formatted_category_names == "\n".join(f"- {name}" for name in names)
+        assert sample_rubric.category_names is sample_rubric.category_names
+        assert sample_rubric.category_name_set == frozenset(names)
+
+    def test_content_hash_ignores_generated_at(self, sample_rubric):
+        """Test that the content hash depends on content, not the generation time."""
+        regenerated = Rubric.model_validate(
+            {**sample_rubric.model_dump(), "generated_at": datetime(2020, 1, 1, tzinfo=timezone.utc)}
+        )
+        renamed = Rubric.model_validate({**sample_rubric.model_dump(), "role_title": "Other Role"})
+
+        assert regenerated.content_hash == sample_rubric.content_hash
+        assert renamed.content_hash != sample_rubric.content_hash
+
+    def test_rubric_is_frozen(self, sample_rubric):
+        """Test that rubrics and their categories cannot be modified after creation."""
+        with pytest.raises(ValidationError):
+            sample_rubric.role_title = "Changed"
+        with pytest.raises(ValidationError):
+            sample_rubric.categories[0].weight = 0.5
+        with pytest.raises(ValidationError):
+            sample_rubric.categories[0].scoring_criteria[0].description = "Changed"
+
     def test_floating_point_weight_tolerance(self, sample_scoring_criteria):
         """Test that weights with floating point errors are accepted."""
         # Weights that sum to ~1.0 due to floating point arithmetic
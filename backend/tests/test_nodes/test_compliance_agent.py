@@ -1,7 +1,7 @@
 """Unit tests for compliance agent node."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from src.nodes.compliance_agent import compliance_agent_node
 
@@ -9,24 +9,22 @@ from src.nodes.compliance_agent import compliance_agent_node
 class TestComplianceAgentNode:
     """Tests for compliance agent node functions."""
 
-    @patch("src.nodes.compliance_agent.get_structured_llm")
-    def test_compliance_agent_node_success(
-        self, mock_get_llm, sample_state_with_rubric, sample_working_memory
+    @patch("src.nodes._agent_base.get_structured_llm")
+    async def test_compliance_agent_node_success(
+        self, mock_get_llm, sample_state_with_rubric, sample_working_memory, sample_hr_review
     ):
         """Test full compliance agent execution."""
-        # Create compliance-specific mocks
+        # Create compliance-specific LLM outputs
         compliance_memory = sample_working_memory.model_copy()
         compliance_memory.agent_role = "Compliance"
 
-        compliance_review = Mock()
-        compliance_review.agent_role = "Compliance"
-        compliance_review.category_scores = []
+        compliance_review = sample_hr_review.model_copy(update={"agent_role": "Compliance"})
 
         mock_llm = Mock()
-        mock_llm.invoke = Mock(side_effect=[compliance_memory, compliance_review])
+        mock_llm.ainvoke = AsyncMock(side_effect=[compliance_memory, compliance_review])
         mock_get_llm.return_value = mock_llm
 
-        result = compliance_agent_node(sample_state_with_rubric)
+        result = await compliance_agent_node(sample_state_with_rubric)
 
         assert "panel_reviews" in result
         assert "agent_working_memory" in result
@@ -1,55 +1,169 @@
 """Unit tests for HR agent node - tests two-pass evaluation pattern."""
 
+import asyncio
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
-from src.nodes.hr_agent import hr_agent_node, _extract_working_memory, _evaluate_with_memory
+from src.nodes._agent_base import extract_working_memory, evaluate_with_memory
+from src.nodes.hr_agent import hr_agent_node
+from src.prompts.agent_prompts import (
+    EVALUATION_RUBRIC_PROMPT,
+    HR_EVALUATION_SYSTEM_PROMPT,
+    WORKING_MEMORY_EXTRACTION_INPUT_PROMPT,
+    WORKING_MEMORY_EXTRACTION_SYSTEM_PROMPT,
+)
+from src.utils.llm import build_prompt_messages
+from src.utils.response_cache import ResponseCache
 
 
 class TestHRAgentNode:
     """Tests for HR agent node functions."""
 
-    @patch("src.nodes.hr_agent.get_structured_llm")
-    def test_extract_working_memory_success(
+    @patch("src.nodes._agent_base.get_structured_llm")
+    async def test_extract_working_memory_success(
         self, mock_get_llm, sample_state_with_rubric, sample_working_memory
     ):
         """Test successful working memory extraction."""
         mock_llm = Mock()
-        mock_llm.invoke = Mock(return_value=sample_working_memory)
+        mock_llm.ainvoke = AsyncMock(return_value=sample_working_memory)
         mock_get_llm.return_value = mock_llm
 
-        result = _extract_working_memory(sample_state_with_rubric)
+        result = await extract_working_memory(
+            sample_state_with_rubric["resume"], sample_state_with_rubric["rubric"], "HR"
+        )
 
         assert result.agent_role == "HR"
         assert len(result.key_observations) >= 3
-        mock_llm.invoke.assert_called_once()
+        mock_llm.ainvoke.assert_awaited_once()
+
+        expected_messages = build_prompt_messages(
+            WORKING_MEMORY_EXTRACTION_SYSTEM_PROMPT.format(agent_role="HR"),
+            WORKING_MEMORY_EXTRACTION_INPUT_PROMPT.format(
+                resume=sample_state_with_rubric["resume"],
+                categories=sample_state_with_rubric["rubric"].formatted_category_names,
+            ),
+        )
+        mock_llm.ainvoke.assert_awaited_once_with(expected_messages)
+
+    @patch("src.nodes._agent_base.get_response_cache")
+    @patch("src.nodes._agent_base.get_structured_llm")
+    async def test_extract_working_memory_reuses_cached_extraction(
+        self, mock_get_llm, mock_get_cache, sample_state_with_rubric, sample_working_memory
+    ):
+        """Test that a repeated extraction is served from the response cache."""
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(return_value=sample_working_memory)
+        mock_get_llm.return_value = mock_llm
+        mock_get_cache.return_value = ResponseCache()
+
+        first = await extract_working_memory(
+            sample_state_with_rubric["resume"], sample_state_with_rubric["rubric"], "HR"
+        )
+        second = await extract_working_memory(
+            sample_state_with_rubric["resume"], sample_state_with_rubric["rubric"], "HR"
+        )
+
+        mock_llm.ainvoke.assert_awaited_once()
+        assert second.model_dump() == first.model_dump()
+
+    @patch("src.nodes._agent_base.get_response_cache")
+    @patch("src.nodes._agent_base.get_structured_llm")
+    async def test_extract_working_memory_disk_cache_runs_off_event_loop(
+        self, mock_get_llm, mock_get_cache, sample_state_with_rubric, sample_working_memory, tmp_path
+    ):
+        """Test that SQLite-backed cache lookups and writes run in a worker thread."""
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(return_value=sample_working_memory)
+        mock_get_llm.return_value = mock_llm
+        mock_get_cache.return_value = ResponseCache(db_path=str(tmp_path / "cache.db"))
+
+        with patch("src.nodes._agent_base.asyncio.to_thread", AsyncMock(wraps=asyncio.to_thread)) as mock_to_thread:
+            for _ in range(2):
+                await extract_working_memory(
+                    sample_state_with_rubric["resume"], sample_state_with_rubric["rubric"], "HR"
+                )
+
+        mock_llm.ainvoke.assert_awaited_once()
+        # Miss (get + set), then hit (get)
+        assert mock_to_thread.await_count == 3
+
+    @patch("src.nodes._agent_base.get_response_cache")
+    @patch("src.nodes._agent_base.get_structured_llm")
+    async def test_extract_working_memory_does_not_cache_invalid_extraction(
+        self, mock_get_llm, mock_get_cache, sample_state_with_rubric, sample_working_memory
+    ):
+        """Test that an extraction failing validation is retried rather than cached."""
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(return_value=sample_working_memory)
+        mock_get_llm.return_value = mock_llm
+        mock_get_cache.return_value = ResponseCache()
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await extract_working_memory(
+                    sample_state_with_rubric["resume"], sample_state_with_rubric["rubric"], "Tech"
+                )
+
+        assert mock_llm.ainvoke.await_count == 2
+
+    @patch("src.nodes._agent_base.get_response_cache")
+    @patch("src.nodes._agent_base.get_structured_llm")
+    async def test_hr_agent_node_rerun_served_from_cache(
+        self, mock_get_llm, mock_get_cache, sample_state_with_rubric, sample_working_memory, sample_hr_review
+    ):
+        """Test that re-running a node with identical inputs reuses both passes."""
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(side_effect=[sample_working_memory, sample_hr_review])
+        mock_get_llm.return_value = mock_llm
+        mock_get_cache.return_value = ResponseCache()
+
+        first = await hr_agent_node(sample_state_with_rubric)
+        second = await hr_agent_node(sample_state_with_rubric)
+
+        assert mock_llm.ainvoke.await_count == 2
+        assert second["panel_reviews"][0].model_dump() == first["panel_reviews"][0].model_dump()
 
-    @patch("src.nodes.hr_agent.get_structured_llm")
-    def test_evaluate_with_memory_success(
+    @patch("src.nodes._agent_base.get_structured_llm")
+    async def test_evaluate_with_memory_success(
         self, mock_get_llm, sample_state_with_rubric, sample_working_memory, sample_hr_review
     ):
         """Test successful evaluation with working memory."""
         mock_llm = Mock()
-        mock_llm.invoke = Mock(return_value=sample_hr_review)
+        mock_llm.ainvoke = AsyncMock(return_value=sample_hr_review)
         mock_get_llm.return_value = mock_llm
 
-        result = _evaluate_with_memory(sample_state_with_rubric, sample_working_memory)
+        result = await evaluate_with_memory(
+            sample_state_with_rubric["resume"],
+            sample_state_with_rubric["rubric"],
+            sample_working_memory,
+            "HR",
+            HR_EVALUATION_SYSTEM_PROMPT,
+        )
 
         assert result.agent_role == "HR"
         assert len(result.category_scores) > 0
-        mock_llm.invoke.assert_called_once()
-
-    @patch("src.nodes.hr_agent.get_structured_llm")
-    def test_hr_agent_node_full_execution(
+        mock_llm.ainvoke.assert_awaited_once()
+
+        # Static instructions go in the system message; the rubric leads the user message
+        system_message, user_message = mock_llm.ainvoke.await_args.args[0]
+        assert system_message.content == HR_EVALUATION_SYSTEM_PROMPT.format()
+        assert user_message.content.startswith(
+            EVALUATION_RUBRIC_PROMPT.format(rubric=sample_state_with_rubric["rubric"].prompt_json)
+        )
+        assert sample_state_with_rubric["resume"] in user_message.content
+
+    @patch("src.nodes._agent_base.get_structured_llm")
+    async def test_hr_agent_node_full_execution(
         self, mock_get_llm, sample_state_with_rubric, sample_working_memory, sample_hr_review
     ):
         """Test full two-pass HR agent execution."""
         # Mock both passes
         mock_llm = Mock()
-        mock_llm.invoke = Mock(side_effect=[sample_working_memory, sample_hr_review])
+        mock_llm.ainvoke = AsyncMock(side_effect=[sample_working_memory, sample_hr_review])
         mock_get_llm.return_value = mock_llm
 
-        result = hr_agent_node(sample_state_with_rubric)
+        result = await hr_agent_node(sample_state_with_rubric)
 
         assert "panel_reviews" in result
         assert "agent_working_memory" in result
@@ -58,18 +172,58 @@ class TestHRAgentNode:
         assert "HR" in result["agent_working_memory"]
         assert result["agent_working_memory"]["HR"].agent_role == "HR"
 
-    def test_extract_working_memory_missing_resume(self):
+    @patch("src.nodes._agent_base.get_structured_llm")
+    async def test_hr_agent_node_returns_only_own_memory(
+        self, mock_get_llm, sample_state_with_rubric, sample_working_memory, sample_hr_review
+    ):
+        """Test that the node returns only its own memory entry for the reducer to merge."""
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(side_effect=[sample_working_memory, sample_hr_review])
+        mock_get_llm.return_value = mock_llm
+
+        tech_memory = sample_working_memory.model_copy(update={"agent_role": "Tech"})
+        state = {**sample_state_with_rubric, "agent_working_memory": {"Tech": tech_memory}}
+
+        result = await hr_agent_node(state)
+
+        assert result["agent_working_memory"] == {"HR": sample_working_memory}
+        assert state["agent_working_memory"] == {"Tech": tech_memory}
+
+    @patch("src.nodes._agent_base.get_structured_llm")
+    async def test_hr_agent_node_canonicalizes_resume(
+        self, mock_get_llm, sample_state_with_rubric, sample_working_memory, sample_hr_review
+    ):
+        """Test that cosmetic resume differences produce identical prompts."""
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(side_effect=[sample_working_memory, sample_hr_review] * 2)
+        mock_get_llm.return_value = mock_llm
+
+        resume = sample_state_with_rubric["resume"]
+        cosmetic_resume = "\n" + resume.replace("\n", "  \r\n") + "\r\n"
+
+        await hr_agent_node(sample_state_with_rubric)
+        await hr_agent_node({**sample_state_with_rubric, "resume": cosmetic_resume})
+
+        prompts = [call.args[0] for call in mock_llm.ainvoke.await_args_list]
+        assert prompts[0] == prompts[2]
+        assert prompts[1] == prompts[3]
+
+    @patch("src.nodes._agent_base.get_structured_llm")
+    async def test_hr_agent_node_missing_resume(self, mock_get_llm):
         """Test error when resume is missing."""
         state = {"rubric": Mock()}
 
         with pytest.raises(ValueError) as exc_info:
-            _extract_working_memory(state)
+            await hr_agent_node(state)
         assert "Resume is missing" in str(exc_info.value)
+        mock_get_llm.assert_not_called()
 
-    def test_extract_working_memory_missing_rubric(self):
+    @patch("src.nodes._agent_base.get_structured_llm")
+    async def test_hr_agent_node_missing_rubric(self, mock_get_llm):
         """Test error when rubric is missing."""
         state = {"resume": "Test resume"}
 
         with pytest.raises(ValueError) as exc_info:
-            _extract_working_memory(state)
+            await hr_agent_node(state)
         assert "Rubric is missing" in str(exc_info.value)
+        mock_get_llm.assert_not_called()
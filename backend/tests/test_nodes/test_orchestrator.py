@@ -8,8 +8,18 @@ import pytest
 from unittest.mock import Mock, patch
 from pydantic import ValidationError
 
+from src.config import get_settings
+
 from src.nodes.orchestrator import orchestrator_node
 from src.models.rubric import Rubric
+from src.prompts.orchestrator_prompts import RUBRIC_GENERATION_PROMPT
+from src.utils.response_cache import ResponseCache, cached_invoke
+from src.utils.validators import (
+    _memoize_by_rubric_content,
+    validate_rubric_completeness,
+    validate_rubric_quality,
+    validate_weight_distribution,
+)
 
 
 class TestOrchestratorNode:
@@ -32,10 +42,47 @@ class TestOrchestratorNode:
         assert "rubric" in result
         assert isinstance(result["rubric"], Rubric)
         assert len(result["rubric"].categories) == 4
+        assert result["rubric_json"] == sample_rubric.prompt_json
 
         # Verify LLM was called
         mock_llm.invoke.assert_called_once()
 
+    @patch("src.nodes.orchestrator.get_structured_llm")
+    def test_orchestrator_prompt_matches_template(
+        self, mock_get_llm, sample_state_initial, sample_rubric
+    ):
+        """Test that the pre-formatted prompt equals formatting the template directly."""
+        mock_llm = Mock()
+        mock_llm.invoke = Mock(return_value=sample_rubric)
+        mock_get_llm.return_value = mock_llm
+
+        orchestrator_node(sample_state_initial)
+
+        mock_llm.invoke.assert_called_once_with(RUBRIC_GENERATION_PROMPT.format(
+            rubric_categories_count=get_settings().rubric_categories_count,
+            job_description=sample_state_initial["job_description"],
+            company_context=sample_state_initial["company_context"],
+        ))
+
+    @patch("src.nodes.orchestrator.get_structured_llm")
+    def test_orchestrator_prompt_ignores_slot_text_in_inputs(
+        self, mock_get_llm, sample_state_initial, sample_rubric
+    ):
+        """Test that slot-like text inside an input is not substituted."""
+        mock_llm = Mock()
+        mock_llm.invoke = Mock(return_value=sample_rubric)
+        mock_get_llm.return_value = mock_llm
+        job_description = "Senior engineer \x00company_context\x00 role"
+        state = {**sample_state_initial, "job_description": job_description}
+
+        orchestrator_node(state)
+
+        mock_llm.invoke.assert_called_once_with(RUBRIC_GENERATION_PROMPT.format(
+            rubric_categories_count=get_settings().rubric_categories_count,
+            job_description=job_description,
+            company_context=sample_state_initial["company_context"],
+        ))
+
     @patch("src.nodes.orchestrator.get_structured_llm")
     def test_orchestrator_missing_job_description(self, mock_get_llm):
         """Test error handling when job_description is missing."""
@@ -122,3 +169,93 @@ class TestOrchestratorNode:
 
         # Verify rubric was still returned
         assert "rubric" in result
+
+    @patch("src.nodes.orchestrator.get_response_cache")
+    @patch("src.nodes.orchestrator.get_structured_llm")
+    def test_orchestrator_reuses_cached_rubric(
+        self, mock_get_llm, mock_get_cache, sample_state_initial, sample_rubric
+    ):
+        """Test that identical inputs reuse the cached rubric instead of calling the LLM."""
+        mock_llm = Mock()
+        mock_llm.invoke = Mock(return_value=sample_rubric)
+        mock_get_llm.return_value = mock_llm
+        mock_get_cache.return_value = ResponseCache()
+
+        first = orchestrator_node(sample_state_initial)
+        second = orchestrator_node(sample_state_initial)
+
+        mock_llm.invoke.assert_called_once()
+        assert second["rubric"] is first["rubric"]
+
+
+class TestRubricValidatorMemoization:
+    """Tests for content-hash memoization of rubric validators."""
+
+    def test_identical_rubrics_share_result(self, sample_rubric):
+        """Test that a rubric with the same content reuses the cached result."""
+        validator = Mock(return_value=(False, ["Issue"]))
+        memoized = _memoize_by_rubric_content(validator)
+
+        first = memoized(sample_rubric)
+        second = memoized(Rubric.model_validate(sample_rubric.model_dump()))
+
+        validator.assert_called_once_with(sample_rubric)
+        assert first == second == (False, ["Issue"])
+        assert second[1] is not first[1]
+
+    def test_public_validators_are_memoized(self):
+        """Test that the rubric validators used by the orchestrator are memoized."""
+        for validator in (validate_rubric_completeness, validate_rubric_quality, validate_weight_distribution):
+            assert hasattr(validator, "cache_clear")
+
+
+class TestResponseCache:
+    """Tests for the exact-match LLM response cache."""
+
+    def test_persists_across_instances(self, tmp_path, sample_rubric):
+        """Test that SQLite-backed entries survive a new cache instance."""
+        db_path = str(tmp_path / "cache.sqlite3")
+        cache = ResponseCache(db_path=db_path)
+        key = cache.make_key("prompt", Rubric)
+        cache.set(key, sample_rubric.model_dump_json())
+
+        reloaded = ResponseCache(db_path=db_path)
+        assert reloaded.get(key) == sample_rubric.model_dump_json()
+        assert reloaded.get(reloaded.make_key("other prompt", Rubric)) is None
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test that entries older than the TTL are not returned."""
+        cache = ResponseCache(ttl_seconds=-1, db_path=str(tmp_path / "cache.sqlite3"))
+        key = cache.make_key("prompt", Rubric)
+        cache.set(key, "{}")
+
+        assert cache.get(key) is None
+
+    def test_frozen_instances_skip_revalidation(self, tmp_path, sample_rubric):
+        """Test that memory hits return the stored instance and disk hits re-validate once."""
+        db_path = str(tmp_path / "cache.sqlite3")
+        llm = Mock()
+        llm.invoke = Mock(return_value=sample_rubric)
+
+        cache = ResponseCache(db_path=db_path)
+        assert cached_invoke(llm, "prompt", Rubric, cache) is sample_rubric
+        assert cached_invoke(llm, "prompt", Rubric, cache) is sample_rubric
+
+        reloaded = ResponseCache(db_path=db_path)
+        from_disk = cached_invoke(llm, "prompt", Rubric, reloaded)
+        assert from_disk is not sample_rubric
+        assert from_disk.model_dump() == sample_rubric.model_dump()
+        assert cached_invoke(llm, "prompt", Rubric, reloaded) is from_disk
+        llm.invoke.assert_called_once()
+
+    def test_memory_tier_evicts_least_recent(self):
+        """Test that the in-memory tier is bounded by max_entries."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
@@ -5,10 +5,13 @@ from unittest.mock import Mock
 
 from src.nodes.synthesis import (
     synthesis_node,
+    _build_score_index,
     _detect_disagreements,
+    _enrich_disagreements_with_memory,
     _calculate_weighted_average_score,
     _create_decision_packet,
     _create_interview_plan,
+    _deduplicate_strengths_risks,
 )
 
 
@@ -19,15 +22,17 @@ class TestSynthesisHelpers:
         self, sample_rubric, sample_hr_review, sample_tech_review
     ):
         """Test disagreement detection when scores are similar."""
-        # Modify reviews to have similar scores
-        hr_review = sample_hr_review.model_copy()
-        tech_review = sample_tech_review.model_copy()
-
         # Set all scores to 4 (no disagreement)
-        for score in hr_review.category_scores:
-            score.score = 4
-        for score in tech_review.category_scores:
-            score.score = 4
+        hr_review = sample_hr_review.model_copy(update={
+            "category_scores": [
+                score.model_copy(update={"score": 4}) for score in sample_hr_review.category_scores
+            ]
+        })
+        tech_review = sample_tech_review.model_copy(update={
+            "category_scores": [
+                score.model_copy(update={"score": 4}) for score in sample_tech_review.category_scores
+            ]
+        })
 
         disagreements = _detect_disagreements([hr_review, tech_review], sample_rubric)
         assert len(disagreements) == 0
@@ -40,28 +45,74 @@ class TestSynthesisHelpers:
         # sample_hr_review has score=4 for LLM Agent Frameworks
         # This should not trigger disagreement (delta < 1)
 
-        # Modify to create actual disagreement
-        hr_review = sample_hr_review.model_copy()
-        tech_review = sample_tech_review.model_copy()
-
         # Set one score to 5, another to 2 (delta = 3)
-        hr_review.category_scores[0].score = 5
-        tech_review.category_scores[0].score = 2
+        hr_scores = list(sample_hr_review.category_scores)
+        hr_scores[0] = hr_scores[0].model_copy(update={"score": 5})
+        tech_scores = list(sample_tech_review.category_scores)
+        tech_scores[0] = tech_scores[0].model_copy(update={"score": 2})
+
+        hr_review = sample_hr_review.model_copy(update={"category_scores": hr_scores})
+        tech_review = sample_tech_review.model_copy(update={"category_scores": tech_scores})
 
         disagreements = _detect_disagreements([hr_review, tech_review], sample_rubric)
         assert len(disagreements) >= 1
 
+    def test_detect_disagreements_names_tied_agents(
+        self, sample_rubric, sample_hr_review, sample_tech_review
+    ):
+        """Test that all agents sharing the max or min score are named in the reason."""
+        hr_scores = list(sample_hr_review.category_scores)
+        hr_scores[0] = hr_scores[0].model_copy(update={"score": 5})
+        tech_scores = list(sample_tech_review.category_scores)
+        tech_scores[0] = tech_scores[0].model_copy(update={"score": 2})
+
+        hr_review = sample_hr_review.model_copy(update={"category_scores": hr_scores})
+        tech_review = sample_tech_review.model_copy(update={"category_scores": tech_scores})
+        compliance_review = hr_review.model_copy(update={"agent_role": "Compliance"})
+
+        disagreements = _detect_disagreements([hr_review, tech_review, compliance_review], sample_rubric)
+        disagreement = next(d for d in disagreements if d.category_name == hr_scores[0].category_name)
+
+        assert disagreement.reason.startswith(
+            "Score conflict detected: HR, Compliance scored 5, while Tech scored 2 (delta: 3.0)."
+        )
+        assert disagreement.resolution_approach.startswith("Critical disagreement")
+
+    def test_enrich_disagreements_with_memory(self, sample_disagreement, sample_working_memory):
+        """Test that disagreement reasons gain per-agent working memory context."""
+        enriched = _enrich_disagreements_with_memory([sample_disagreement], {"HR": sample_working_memory})
+
+        assert len(enriched) == 1
+        lines = enriched[0].reason.split("\n")
+        assert lines[0] == sample_disagreement.reason
+        assert lines[2] == "Working Memory Context:"
+        assert lines[3] == "- HR (score: 4) noted:"
+        assert lines[4] == (
+            "  • Implemented PII detection and bias mitigation framework "
+            "(from Experience section, 3rd bullet) [strength]"
+        )
+        assert enriched[0].agent_scores == sample_disagreement.agent_scores
+        assert enriched[0].score_delta == sample_disagreement.score_delta
+        assert sample_disagreement.reason == lines[0]
+
     def test_calculate_weighted_average_score(
         self, sample_hr_review, sample_tech_review
     ):
         """Test weighted average score calculation."""
         category_name = "LLM Agent Frameworks"
-        avg_score = _calculate_weighted_average_score(
-            category_name, [sample_hr_review, sample_tech_review]
-        )
+        score_index = _build_score_index([sample_hr_review, sample_tech_review])
+        avg_score = _calculate_weighted_average_score(category_name, score_index)
 
         # HR=4, Tech=5, average should be 4.5
         assert avg_score == 4.5
+        assert score_index[category_name] == {"HR": 4, "Tech": 5}
+        assert _calculate_weighted_average_score("Unscored Category", score_index) == 0.0
+
+    def test_deduplicate_strengths_risks(self):
+        """Test that repeated items rank first and ties keep first-seen order."""
+        items = ["A", "b", "B ", "c", "d", "e", "f", "a"]
+
+        assert _deduplicate_strengths_risks(items) == ["A", "b", "c", "d", "e"]
 
     def test_create_decision_packet(
         self, sample_rubric, sample_hr_review, sample_tech_review, sample_working_memory
@@ -98,6 +149,31 @@ class TestSynthesisHelpers:
         total_questions = sum(len(questions) for questions in plan.questions_by_interviewer.values())
         assert total_questions >= 1
 
+    def test_create_interview_plan_caps_questions_per_interviewer(
+        self, sample_rubric, sample_hr_review, sample_tech_review, sample_disagreement, sample_working_memory
+    ):
+        """Test that each interviewer gets at most 7 questions and priority areas keep their order."""
+        disagreements = [
+            sample_disagreement.model_copy(update={"category_name": f"Category {i}", "agent_scores": {"HR": 2, "Tech": 4}})
+            for i in range(6)
+        ]
+        hr_memory = sample_working_memory.model_copy(update={
+            "ambiguities": ["A1", "A2"],
+            "missing_information": ["M1", "M2"],
+        })
+
+        plan = _create_interview_plan(
+            sample_rubric,
+            [sample_hr_review, sample_tech_review],
+            disagreements,
+            {"HR": hr_memory},
+        )
+
+        hr_questions = plan.questions_by_interviewer["HR"]
+        assert len(hr_questions) == 7
+        assert [q.category for q in hr_questions[6:]] == ["Clarification"]
+        assert plan.priority_areas == [f"Category {i}" for i in range(6)]
+
 
 class TestSynthesisNode:
     """Tests for synthesis_node function."""
@@ -113,6 +189,29 @@ class TestSynthesisNode:
         assert "interview_plan" in result
         assert isinstance(result["disagreements"], list)
 
+    def test_synthesis_node_single_review_skips_disagreements(
+        self, sample_rubric, sample_hr_review, sample_working_memory
+    ):
+        """Test that a single review yields no disagreements but a full packet and plan."""
+        # Low scores give the plan must-have gaps to prioritize
+        hr_review = sample_hr_review.model_copy(update={
+            "category_scores": [
+                score.model_copy(update={"score": 2}) for score in sample_hr_review.category_scores
+            ]
+        })
+        state = {
+            "rubric": sample_rubric,
+            "panel_reviews": [hr_review],
+            "agent_working_memory": {"HR": sample_working_memory},
+        }
+
+        result = synthesis_node(state)
+
+        assert result["disagreements"] == []
+        assert 0.0 <= result["decision_packet"].overall_fit_score <= 5.0
+        assert list(result["interview_plan"].questions_by_interviewer) == ["HR"]
+        assert result["interview_plan"].priority_areas
+
     def test_synthesis_node_missing_rubric(self):
         """Test error when rubric is missing."""
         state = {"panel_reviews": [], "agent_working_memory": {}}